@@ -0,0 +1,125 @@
+"""
+Command line entry point, e.g.
+
+    python -m aoc run --year 2021 --day all
+    python -m aoc run --year 2021 --day 1,5
+    python -m aoc run --year 2021 --backend numpy
+    python -m aoc run --year 2021 --day 13 --profile phases,memory
+    python -m aoc run --year 2021 --day 12 --metrics prometheus
+    python -m aoc generate --year 2021 --day 1 --size 10000000 --out sonar.txt
+    python -m aoc bench --year 2021 --day 3 --save baseline.json
+    python -m aoc bench --year 2021 --compare baseline.json
+"""
+
+import argparse
+import sys
+import time
+
+from aoc import registry
+
+
+def parse_days(value):
+    if value == 'all':
+        return None
+    return [int(d) for d in value.split(',')]
+
+
+def parse_sizes(value):
+    return [int(s) for s in value.split(',')]
+
+
+def select_days(parser, years, days):
+    year_days = []
+    for year in years or registry.find_years():
+        found = registry.find_solvers(year)
+        for day in days or found:
+            if day in found:
+                year_days.append((year, day))
+            elif years:
+                parser.error(f'no solution for {year} day {day}')
+    return year_days
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aoc', description='Advent of Code solutions')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='solve puzzles, reporting answers and timings')
+    run_parser.add_argument('--year', type=int, action='append', help='year to run (default: every year)')
+    run_parser.add_argument('--day', type=parse_days, default=None, help="comma separated days, or 'all' (default)")
+    run_parser.add_argument('--workers', type=int, default=None, help='worker processes (default: number of cores)')
+    run_parser.add_argument('--separate', action='store_true',
+                            help='solve part 1 and part 2 separately, rather than together with the solve function')
+    run_parser.add_argument('--backend', default='python',
+                            help="alternative implementation to use where a day has one, e.g. 'numpy'")
+    run_parser.add_argument('--profile', default=None,
+                            help="comma separated 'cprofile', 'memory', 'phases', or 'all' (sets AOC_PROFILE)")
+    run_parser.add_argument('--metrics', choices=['json', 'prometheus'], default=None,
+                            help='count hot operations, reporting them in this format (sets AOC_METRICS)')
+
+    generate_parser = commands.add_parser('generate', help='write a generated puzzle input of any size')
+    generate_parser.add_argument('--year', type=int, required=True)
+    generate_parser.add_argument('--day', type=int, required=True)
+    generate_parser.add_argument('--size', type=int, required=True, help='input size, e.g. number of lines')
+    generate_parser.add_argument('--seed', type=int, default=0)
+    generate_parser.add_argument('--out', default='-', help="output file (default: '-' for stdout)")
+
+    bench_parser = commands.add_parser('bench', help='benchmark solutions across generated input sizes')
+    bench_parser.add_argument('--year', type=int, action='append', help='year to benchmark (default: every year)')
+    bench_parser.add_argument('--day', type=parse_days, default=None, help="comma separated days, or 'all' (default)")
+    bench_parser.add_argument('--sizes', type=parse_sizes, default=None,
+                              help='comma separated input sizes (default: a range suited to each day)')
+    bench_parser.add_argument('--repeats', type=int, default=5, help='timed runs at each size')
+    bench_parser.add_argument('--seed', type=int, default=0)
+    bench_parser.add_argument('--save', help='write the results to this JSON baseline file')
+    bench_parser.add_argument('--compare', help='fail if the results regress against this JSON baseline file')
+    bench_parser.add_argument('--tolerance', type=float, default=0.25,
+                              help='allowed slow down against the baseline, as a fraction (default: 0.25)')
+
+    args = parser.parse_args(argv)
+
+    # each command's modules are imported only when it runs, keeping start up fast
+    if args.command == 'generate':
+        from aoc import generators
+
+        if (args.year, args.day) not in generators.generators:
+            parser.error(f'no generator for {args.year} day {args.day}')
+        generators.write_input(args.year, args.day, args.size, args.out, args.seed)
+        return 0
+
+    if args.command == 'bench':
+        from aoc import benchmark, generators
+
+        year_days = [yd for yd in select_days(parser, args.year, args.day) if yd in generators.generators]
+        results = benchmark.run(year_days, args.sizes, args.repeats, args.seed)
+        benchmark.print_results(results)
+
+        if args.save:
+            benchmark.save(results, args.save)
+
+        if args.compare:
+            regressions = benchmark.compare(results, benchmark.load(args.compare), args.tolerance)
+            for regression in regressions:
+                print(f'REGRESSION {regression}')
+            if regressions:
+                return 1
+        return 0
+
+    if args.command == 'run':
+        from aoc import runner
+        from shared import metrics, profiling
+
+        year_days = select_days(parser, args.year, args.day)
+        if args.profile:
+            profiling.enable(args.profile)
+        if args.metrics:
+            metrics.enable()
+
+        start = time.perf_counter()
+        results = runner.run(year_days, args.workers, args.separate, args.backend)
+        runner.print_results(results, time.perf_counter() - start, args.metrics)
+        return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Benchmarks each solution across a range of generated input sizes, recording latency and peak memory,
+fitting an empirical complexity exponent, and comparing against a stored JSON baseline.
+"""
+
+import contextlib
+import io
+import json
+import math
+import statistics
+import time
+import tracemalloc
+
+from aoc import generators, registry
+
+# input sizes (see aoc.generators for what size means for each puzzle), chosen to run in seconds
+default_sizes = {
+    (2021, 1): [10000, 20000, 40000, 80000],
+    (2021, 2): [10000, 20000, 40000, 80000],
+    (2021, 3): [1000, 2000, 4000, 8000],
+    (2021, 4): [100, 200, 400, 800],
+    (2021, 5): [250, 500, 1000, 2000],
+    (2021, 6): [25, 50, 100, 200],
+    (2021, 7): [250, 500, 1000, 2000],
+    (2021, 8): [1000, 2000, 4000, 8000],
+    (2021, 9): [50, 100, 200, 400],
+    (2021, 10): [500, 1000, 2000, 4000],
+    (2021, 11): [3, 5, 6],
+    (2021, 12): [8, 16, 24, 32],
+    (2021, 13): [500, 1000, 2000, 4000],
+    (2022, 1): [1000, 2000, 4000, 8000],
+}
+
+
+def benchmark_part(func, data, repeats):
+    """
+    :return: (median seconds, p95 seconds, peak traced memory in bytes)
+    """
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(data)
+            timings.append(time.perf_counter() - start)
+
+        # separate run for memory, as tracing slows everything down
+        tracemalloc.start()
+        try:
+            func(data)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    timings.sort()
+    p95 = timings[max(0, math.ceil(0.95 * len(timings)) - 1)]
+    return statistics.median(timings), p95, peak
+
+
+def fit_exponent(sizes, timings):
+    """
+    Least squares fit of log(time) against log(size), the slope being the empirical complexity exponent
+    i.e. ~1 for linear, ~2 for quadratic
+    """
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, timings) if s > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run(year_days, sizes=None, repeats=5, seed=0):
+    """
+    :return: dict of 'year/day/part' -> results for each size and the fitted exponent
+    """
+    results = {}
+    for year, day in year_days:
+        module, _ = registry.load(registry.get(year, day))
+        day_sizes = sizes or default_sizes[(year, day)]
+
+        for part in (1, 2):
+            results[f'{year}/{day}/{part}'] = {'sizes': day_sizes, 'median': [], 'p95': [], 'peak_bytes': []}
+
+        for size in day_sizes:
+            data = ''.join(generators.generate(year, day, size, seed)).splitlines()
+            for part in (1, 2):
+                median, p95, peak = benchmark_part(getattr(module, f'part{part}'), data, repeats)
+                result = results[f'{year}/{day}/{part}']
+                result['median'].append(median)
+                result['p95'].append(p95)
+                result['peak_bytes'].append(peak)
+
+        for part in (1, 2):
+            result = results[f'{year}/{day}/{part}']
+            result['exponent'] = fit_exponent(result['sizes'], result['median'])
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.25, exponent_tolerance=0.3):
+    """
+    Compare results against a baseline. A regression is a median time more than tolerance slower than the baseline
+    at the same size, or a complexity exponent more than exponent_tolerance above the baseline's.
+    :return: list of regression messages, empty if none
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        base = baseline[key]
+
+        base_medians = dict(zip(base['sizes'], base['median']))
+        for size, median in zip(result['sizes'], result['median']):
+            if size in base_medians and median > base_medians[size] * (1 + tolerance):
+                regressions.append(f'{key} size {size}: median {median * 1000:.2f} ms, '
+                                   f'baseline {base_medians[size] * 1000:.2f} ms')
+
+        if result['exponent'] is not None and base.get('exponent') is not None:
+            if result['exponent'] > base['exponent'] + exponent_tolerance:
+                regressions.append(f"{key}: complexity exponent {result['exponent']:.2f}, "
+                                   f"baseline {base['exponent']:.2f}")
+    return regressions
+
+
+def save(results, filename):
+    with open(filename, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load(filename):
+    with open(filename) as file:
+        return json.load(file)
+
+
+def print_results(results):
+    print(f"{'solver':>10} {'size':>8} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10}")
+    for key, result in results.items():
+        for size, median, p95, peak in zip(result['sizes'], result['median'], result['p95'], result['peak_bytes']):
+            print(f'{key:>10} {size:>8} {median * 1000:>10.3f} {p95 * 1000:>10.3f} {peak / 1024:>10.1f}')
+        exponent = result['exponent']
+        print(f"{key:>10} exponent {'n/a' if exponent is None else f'{exponent:.2f}'}")
@@ -0,0 +1,363 @@
+"""
+Seeded generators of valid puzzle inputs of any size, for testing the solutions at scale.
+Each generator yields the input a piece at a time, so even very large inputs are streamed straight to disk.
+"""
+
+import random
+import string
+import sys
+
+# canonical segments lit for each digit on a seven segment display
+seven_segment_digits = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+brackets = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+def sonar_depths(size, rng):
+    """size: number of depth readings"""
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(1, depth + rng.randint(-5, 10))
+        yield f'{depth}\n'
+
+
+def dive_commands(size, rng):
+    """size: number of commands"""
+    depth = 0
+    for _ in range(size):
+        val = rng.randint(1, 9)
+        direction = rng.choice(('forward', 'down', 'up'))
+        if direction == 'up' and val > depth:
+            direction = 'down'
+
+        if direction == 'down':
+            depth += val
+        elif direction == 'up':
+            depth -= val
+        yield f'{direction} {val}\n'
+
+
+def diagnostic_report(size, rng, width=None):
+    """
+    size: number of binary numbers, width: number of bits in each (by default, enough for twice the size)
+    Numbers are distinct, from a random bijection of 0..size-1, so a rating search always narrows to one number
+    """
+    if width is None:
+        width = max(12, size.bit_length() + 1)
+    if size > 1 << width:
+        raise ValueError(f'cannot generate {size} distinct {width} bit numbers')
+
+    mask = (1 << width) - 1
+    multiplier = rng.getrandbits(width) | 1
+    offset = rng.getrandbits(width)
+    for i in range(size):
+        n = (i * multiplier + offset) & mask
+        n ^= n >> (width // 2)
+        yield f'{n:0{width}b}\n'
+
+
+def bingo(size, rng, numbers=100, board_size=5):
+    """size: number of boards. Every number is called, so every board wins"""
+    called = list(range(numbers))
+    rng.shuffle(called)
+    yield ','.join(map(str, called)) + '\n'
+
+    for _ in range(size):
+        yield '\n'
+        board = rng.sample(range(numbers), board_size * board_size)
+        for r in range(board_size):
+            yield ' '.join(f'{n:>2}' for n in board[r * board_size:(r + 1) * board_size]) + '\n'
+
+
+def vent_lines(size, rng, extent=1000):
+    """size: number of vent lines, extent: width and height of the area"""
+    for _ in range(size):
+        x1 = rng.randrange(extent)
+        y1 = rng.randrange(extent)
+        kind = rng.randrange(3)
+
+        if kind == 0:
+            x2, y2 = rng.randrange(extent), y1
+        elif kind == 1:
+            x2, y2 = x1, rng.randrange(extent)
+        else:
+            # 45 degree line, kept within the area
+            dx = rng.choice((-1, 1))
+            dy = rng.choice((-1, 1))
+            limit_x = extent - 1 - x1 if dx > 0 else x1
+            limit_y = extent - 1 - y1 if dy > 0 else y1
+            length = rng.randint(0, min(limit_x, limit_y))
+            x2, y2 = x1 + dx * length, y1 + dy * length
+
+        yield f'{x1},{y1} -> {x2},{y2}\n'
+
+
+def __comma_separated(values):
+    first = True
+    for value in values:
+        yield f'{value}' if first else f',{value}'
+        first = False
+    yield '\n'
+
+
+def lanternfish_timers(size, rng):
+    """size: number of fish"""
+    return __comma_separated(rng.randint(1, 5) for _ in range(size))
+
+
+def crab_positions(size, rng, extent=2000):
+    """size: number of crabs, extent: range of horizontal positions"""
+    return __comma_separated(rng.randrange(extent) for _ in range(size))
+
+
+def seven_segment_entries(size, rng):
+    """size: number of display entries"""
+    for _ in range(size):
+        wires = list('abcdefg')
+        rng.shuffle(wires)
+        wiring = dict(zip('abcdefg', wires))
+
+        patterns = []
+        for segments in seven_segment_digits:
+            pattern = [wiring[s] for s in segments]
+            rng.shuffle(pattern)
+            patterns.append(''.join(pattern))
+
+        outputs = []
+        for _ in range(4):
+            pattern = list(rng.choice(patterns))
+            rng.shuffle(pattern)
+            outputs.append(''.join(pattern))
+
+        rng.shuffle(patterns)
+        yield f"{' '.join(patterns)} | {' '.join(outputs)}\n"
+
+
+def heightmap(size, rng, width=100):
+    """
+    size: number of rows, width: number of columns
+    The map is split into basins by walls of 9s, each basin sloping down to a single low point
+    """
+    col_blocks = []
+    wall_cols = set()
+    c = 0
+    while c < width:
+        block_width = rng.randint(2, 8)
+        col_blocks.append((c, min(c + block_width, width)))
+        c += block_width
+        if c < width:
+            wall_cols.add(c)
+            c += 1
+
+    rows = 0
+    while rows < size:
+        block_height = min(rng.randint(2, 8), size - rows)
+        centres = [(rng.randrange(block_height), rng.randrange(start, end)) for start, end in col_blocks]
+
+        for r in range(block_height):
+            row = ['9'] * width
+            for (start, end), (centre_r, centre_c) in zip(col_blocks, centres):
+                for col in range(start, end):
+                    row[col] = str(min(8, abs(r - centre_r) + abs(col - centre_c)))
+            yield ''.join(row) + '\n'
+        rows += block_height
+
+        if rows < size:
+            yield '9' * width + '\n'
+            rows += 1
+
+
+def navigation_subsystem(size, rng, length=100):
+    """size: number of lines, each either corrupted or incomplete"""
+    openers = list(brackets)
+    for _ in range(size):
+        corrupt = rng.random() < 0.5
+        corrupt_at = rng.randrange(length // 2, length)
+        stack = []
+        line = []
+
+        for i in range(length):
+            if stack and rng.random() < 0.45:
+                closer = brackets[stack.pop()]
+                if corrupt and i >= corrupt_at:
+                    closer = rng.choice([b for b in brackets.values() if b != closer])
+                    corrupt = False
+                line.append(closer)
+            else:
+                opener = rng.choice(openers)
+                stack.append(opener)
+                line.append(opener)
+
+        if not stack:
+            line.append(rng.choice(openers))
+        yield ''.join(line) + '\n'
+
+
+def __octopus_sync_step(grid, limit):
+    """First step, up to the limit, on which every octopus in the grid flashes together, or None"""
+    size = len(grid)
+    grid = [row[:] for row in grid]
+    for step in range(1, limit + 1):
+        pending = []
+        for r, row in enumerate(grid):
+            for c in range(size):
+                row[c] += 1
+                if row[c] > 9:
+                    pending.append((r, c))
+
+        flashes = 0
+        while pending:
+            r, c = pending.pop()
+            if grid[r][c] == 0:
+                continue
+            grid[r][c] = 0
+            flashes += 1
+            for nr in range(max(0, r - 1), min(size, r + 2)):
+                for nc in range(max(0, c - 1), min(size, c + 2)):
+                    if grid[nr][nc]:
+                        grid[nr][nc] += 1
+                        if grid[nr][nc] > 9:
+                            pending.append((nr, nc))
+
+        if flashes == size * size:
+            return step
+    return None
+
+
+def octopus_grid(size, rng, sync_limit=300):
+    """
+    size: width and height of the grid. Large random grids rarely ever synchronise, so grids are drawn with a
+    narrowing range of energy levels until one flashes all together within sync_limit steps (a grid of one level
+    always does), leaving part 2 an answer
+    """
+    for low in range(10):
+        grid = [[rng.randint(low, 9) for _ in range(size)] for _ in range(size)]
+        if __octopus_sync_step(grid, sync_limit) is not None:
+            break
+
+    for row in grid:
+        yield ''.join(map(str, row)) + '\n'
+
+
+def __cave_name(n, small):
+    # prefixed, so never clashes with 'start' or 'end'
+    letters = string.ascii_lowercase if small else string.ascii_uppercase
+    name = letters[2]
+    while True:
+        name += letters[n % 26]
+        n //= 26
+        if n == 0:
+            return name
+
+
+def cave_system(size, rng):
+    """
+    size: number of small caves. Big caves are never connected to each other, so the number of paths is finite,
+    but it still grows exponentially, keep the size small
+    """
+    small = [__cave_name(n, True) for n in range(size)]
+    big = [__cave_name(n, False) for n in range(max(1, size // 3))]
+
+    edges = set()
+    for cave in small:
+        for _ in range(rng.randint(1, 2)):
+            other = rng.choice(big if rng.random() < 0.5 else small)
+            if other != cave:
+                edges.add(tuple(sorted((cave, other))))
+
+    edges.add(('start', rng.choice(small)))
+    edges.add(('start', rng.choice(big)))
+    edges.add((rng.choice(small), 'end'))
+    edges.add((rng.choice(big), 'end'))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    for a, b in edges:
+        yield f'{a}-{b}\n'
+
+
+def origami(size, rng, folds=5):
+    """
+    size: number of dots. The sheet folds (alternately along x and y) down to the 40 x 6 code display
+    """
+    width, height = 40, 6
+    instructions = []
+    for _ in range(folds):
+        instructions.append(('x', width))
+        instructions.append(('y', height))
+        width = width * 2 + 1
+        height = height * 2 + 1
+    instructions.reverse()
+
+    produced = 0
+    while produced < size:
+        x = rng.randrange(width)
+        y = rng.randrange(height)
+
+        # dots never appear on a fold line
+        fx, fy = x, y
+        valid = True
+        for axis, fold in instructions:
+            value = fx if axis == 'x' else fy
+            if value == fold:
+                valid = False
+                break
+            if value > fold:
+                value = fold * 2 - value
+            if axis == 'x':
+                fx = value
+            else:
+                fy = value
+
+        if valid:
+            produced += 1
+            yield f'{x},{y}\n'
+
+    yield '\n'
+    for axis, fold in instructions:
+        yield f'fold along {axis}={fold}\n'
+
+
+def calorie_counts(size, rng):
+    """size: number of elves"""
+    for _ in range(size):
+        for _ in range(rng.randint(1, 15)):
+            yield f'{rng.randint(1000, 60000)}\n'
+        yield '\n'
+
+
+generators = {
+    (2021, 1): sonar_depths,
+    (2021, 2): dive_commands,
+    (2021, 3): diagnostic_report,
+    (2021, 4): bingo,
+    (2021, 5): vent_lines,
+    (2021, 6): lanternfish_timers,
+    (2021, 7): crab_positions,
+    (2021, 8): seven_segment_entries,
+    (2021, 9): heightmap,
+    (2021, 10): navigation_subsystem,
+    (2021, 11): octopus_grid,
+    (2021, 12): cave_system,
+    (2021, 13): origami,
+    (2022, 1): calorie_counts,
+}
+
+
+def generate(year, day, size, seed=0, **kwargs):
+    """
+    Generate an input for a puzzle
+    :return: generator of text pieces, which concatenated make up the input file
+    """
+    return generators[(year, day)](size, random.Random(seed), **kwargs)
+
+
+def write_input(year, day, size, filename, seed=0, **kwargs):
+    """
+    Stream a generated input to a file ('-' for stdout)
+    """
+    if filename == '-':
+        sys.stdout.writelines(generate(year, day, size, seed, **kwargs))
+    else:
+        with open(filename, 'w', buffering=1 << 20) as file:
+            file.writelines(generate(year, day, size, seed, **kwargs))
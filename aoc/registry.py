@@ -0,0 +1,67 @@
+"""
+Finds the solution modules by year and day from their file names, without importing them,
+so only the module for the day being solved is ever loaded.
+"""
+
+import importlib
+import os
+import re
+import time
+from collections import namedtuple
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+year_dir_pattern = re.compile(r'^aoc_(\d{4})$')
+day_module_pattern = re.compile(r'^day(\d\d)(_\w+)?\.py$')
+
+Solver = namedtuple('Solver', ['year', 'day', 'module_name', 'path'])
+
+
+def find_years():
+    years = []
+    for name in os.listdir(root_dir):
+        match = year_dir_pattern.match(name)
+        if match and os.path.isdir(os.path.join(root_dir, name)):
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def find_solvers(year):
+    """
+    Find the solution modules for a year from their file names, e.g. aoc_2021/day01_sonar_sweep.py
+    :return: dict of day number -> Solver, in day order
+    """
+    year_dir = os.path.join(root_dir, f'aoc_{year}')
+    if not os.path.isdir(year_dir):
+        return {}
+
+    solvers = {}
+    for name in os.listdir(year_dir):
+        match = day_module_pattern.match(name)
+        if match:
+            day = int(match.group(1))
+            solvers[day] = Solver(year, day, f'aoc_{year}.{name[:-3]}', os.path.join(year_dir, name))
+    return dict(sorted(solvers.items()))
+
+
+def get(year, day):
+    solvers = find_solvers(year)
+    if day not in solvers:
+        raise LookupError(f'no solution for {year} day {day}')
+    return solvers[day]
+
+
+def load(solver):
+    """
+    Import a solution module
+    :return: (module, seconds taken to import it, 0 if it was already imported)
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(solver.module_name)
+    return module, time.perf_counter() - start
+
+
+def input_path(solver, module):
+    """
+    Path of a module's puzzle input, its input_file being relative to the module's directory
+    """
+    return os.path.join(os.path.dirname(solver.path), module.input_file)
@@ -0,0 +1,119 @@
+"""
+Runs the solutions for a whole year (or selected days) across a pool of processes, reporting the answer and timings
+for each part.
+"""
+
+import contextlib
+import io
+import time
+from collections import namedtuple
+
+from aoc import registry
+from shared import metrics
+from shared.file_reader import read_input
+
+Result = namedtuple('Result', ['year', 'day', 'part', 'answer', 'wall', 'cpu', 'import_time', 'parse', 'solve',
+                               'output', 'error', 'metrics'])
+
+
+def solve_part(solver, part, backend='python'):
+    """
+    Import a day's module, read its input and solve one part, or both parts together with the module's solve function
+    when part is 'both'. Runs in a worker process.
+    A backend other than 'python' uses the module's alternative functions, e.g. solve_numpy or part1_numpy,
+    falling back to the plain functions for days without them.
+    Import time is 0 if the worker has already imported the module for the day's other part.
+    Parse time is the time to read the input file, solve time the time spent in the part (or solve) function.
+    Anything the part prints (including any profiling report) is captured and returned as the output.
+    If metrics are enabled, the day's counters for just this part are returned too.
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    answer = None
+    error = None
+    import_time = parse = solve = 0.0
+    output = io.StringIO()
+
+    try:
+        module, import_time = registry.load(solver)
+
+        start = time.perf_counter()
+        data = read_input(registry.input_path(solver, module))
+        parse = time.perf_counter() - start
+
+        metrics.reset()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            answer = __find_function(module, 'solve' if part == 'both' else f'part{part}', backend)(data)
+        solve = time.perf_counter() - start
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+
+    return Result(solver.year, solver.day, part, answer, time.perf_counter() - wall_start,
+                  time.process_time() - cpu_start, import_time, parse, solve, output.getvalue(), error,
+                  metrics.snapshot(f'aoc_{solver.year}_day{solver.day:02d}_'))
+
+
+def __find_function(module, name, backend):
+    if backend != 'python' and hasattr(module, f'{name}_{backend}'):
+        return getattr(module, f'{name}_{backend}')
+    return getattr(module, name)
+
+
+def run(year_days, workers=None, separate=False, backend='python'):
+    """
+    Solve both parts of every requested day, spreading the days across a process pool.
+    Both parts are solved together, parsing the input once, if the day has a solve function.
+    A single task is solved in this process, without starting a pool.
+    :param year_days: list of (year, day) to solve
+    :param workers: number of worker processes, defaults to the number of cores
+    :param separate: solve each part separately, with part1 and part2, even if the day has a solve function
+    :param backend: 'python', or the name of an alternative implementation e.g. 'numpy' for solve_numpy
+    :return: list of Result in year, day, part order
+    """
+    tasks = []
+    for year, day in year_days:
+        solver = registry.get(year, day)
+        if not separate and __has_solve(solver):
+            tasks.append((solver, 'both', backend))
+        else:
+            for part in (1, 2):
+                tasks.append((solver, part, backend))
+
+    if len(tasks) == 1:
+        return [solve_part(*tasks[0])]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_part, *task) for task in tasks]
+        return [f.result() for f in futures]
+
+
+def __has_solve(solver):
+    # checked from the source, so the module isn't imported in this process
+    with open(solver.path) as file:
+        return '\ndef solve(' in file.read()
+
+
+def print_results(results, elapsed, metrics_format=None):
+    print(f"{'year':>4} {'day':>3} {'part':>4}  {'answer':>28} {'wall ms':>10} {'cpu ms':>10} "
+          f"{'import ms':>10} {'parse ms':>10} {'solve ms':>10}")
+
+    for r in results:
+        if r.error:
+            answer = r.error
+        elif r.part == 'both':
+            answer = f'{r.answer[0]} / {r.answer[1]}'
+        else:
+            answer = r.answer
+        print(f'{r.year:>4} {r.day:>3} {r.part:>4}  {str(answer):>28} {r.wall * 1000:>10.2f} {r.cpu * 1000:>10.2f} '
+              f'{r.import_time * 1000:>10.2f} {r.parse * 1000:>10.2f} {r.solve * 1000:>10.2f}')
+        if r.output.strip():
+            print(r.output.rstrip('\n'))
+        if metrics_format and r.metrics:
+            print(metrics.to_prometheus(r.metrics) if metrics_format == 'prometheus' else metrics.to_json(r.metrics))
+
+    parts = sum(2 if r.part == 'both' else 1 for r in results)
+    print(f'\n{parts} parts solved in {elapsed * 1000:.2f} ms')
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from aoc.benchmark import benchmark_part, compare, fit_exponent, load, save
+
+
+def result(sizes, medians, exponent):
+    return {'sizes': sizes, 'median': medians, 'p95': medians, 'peak_bytes': [0] * len(sizes), 'exponent': exponent}
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_fit_exponent_linear(self):
+        sizes = [1000, 2000, 4000, 8000]
+        timings = [s * 1e-6 * f for s, f in zip(sizes, (1.02, 0.97, 1.01, 0.99))]
+        self.assertAlmostEqual(1, fit_exponent(sizes, timings), delta=0.05)
+
+    def test_fit_exponent_quadratic(self):
+        sizes = [100, 200, 400, 800]
+        timings = [s * s * 1e-8 * f for s, f in zip(sizes, (0.98, 1.03, 1.0, 0.99))]
+        self.assertAlmostEqual(2, fit_exponent(sizes, timings), delta=0.05)
+
+    def test_fit_exponent_too_few_points(self):
+        self.assertIsNone(fit_exponent([100], [0.1]))
+        self.assertIsNone(fit_exponent([100, 100], [0.1, 0.2]))
+        self.assertIsNone(fit_exponent([100, 200], [0, 0.2]))
+
+    def test_compare_no_regression(self):
+        baseline = {'2021/1/1': result([10, 20], [0.010, 0.020], 1.0)}
+        results = {'2021/1/1': result([10, 20], [0.011, 0.021], 1.1), '2021/2/1': result([10], [1.0], None)}
+        self.assertEqual([], compare(results, baseline))
+
+    def test_compare_median_regression(self):
+        baseline = {'2021/1/1': result([10, 20], [0.010, 0.020], 1.0)}
+        results = {'2021/1/1': result([10, 20], [0.010, 0.030], 1.0)}
+        regressions = compare(results, baseline)
+        self.assertEqual(1, len(regressions))
+        self.assertIn('2021/1/1 size 20', regressions[0])
+
+    def test_compare_exponent_regression(self):
+        baseline = {'2021/1/1': result([10, 20], [0.010, 0.020], 1.0)}
+        results = {'2021/1/1': result([10, 20], [0.009, 0.024], 1.4)}
+        regressions = compare(results, baseline)
+        self.assertEqual(1, len(regressions))
+        self.assertIn('complexity exponent 1.40', regressions[0])
+
+    def test_benchmark_part(self):
+        median, p95, peak = benchmark_part(lambda data: [x * 2 for x in data], list(range(1000)), 3)
+        self.assertGreater(median, 0)
+        self.assertGreaterEqual(p95, median)
+        self.assertGreater(peak, 0)
+
+    def test_save_load(self):
+        results = {'2021/1/1': result([10, 20], [0.010, 0.020], 1.0)}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'baseline.json')
+            save(results, filename)
+            self.assertEqual(results, load(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import importlib
+import unittest
+from aoc.generators import generators, generate
+from aoc.registry import get
+
+
+def generated_data(year, day, size, seed=0):
+    return ''.join(generate(year, day, size, seed)).splitlines()
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_every_generator_is_solvable(self):
+        for year, day in generators:
+            with self.subTest(year=year, day=day):
+                module = importlib.import_module(get(year, day).module_name)
+                answers = module.solve(generated_data(year, day, 6))
+                self.assertEqual(2, len(answers))
+
+    def test_generate_is_seeded(self):
+        for year, day in generators:
+            with self.subTest(year=year, day=day):
+                self.assertEqual(generated_data(year, day, 6, seed=1), generated_data(year, day, 6, seed=1))
+
+    def test_octopus_grid_synchronises(self):
+        solver = importlib.import_module(get(2021, 11).module_name)
+        for size in (3, 10, 20):
+            for seed in range(3):
+                with self.subTest(size=size, seed=seed):
+                    data = generated_data(2021, 11, size, seed)
+                    self.assertEqual(size, len(data))
+                    self.assertTrue(all(len(row) == size for row in data))
+                    self.assertLess(solver.part2(data), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import unittest
+from unittest import mock
+from aoc import registry
+from aoc.runner import run, solve_part
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_find_years(self):
+        self.assertIn(2021, registry.find_years())
+        self.assertIn(2022, registry.find_years())
+
+    def test_find_solvers(self):
+        solvers = registry.find_solvers(2021)
+        self.assertEqual(list(range(1, 14)), list(solvers))
+        self.assertEqual('aoc_2021.day01_sonar_sweep', solvers[1].module_name)
+        self.assertEqual('aoc_2021.day11_dumbo_octopus', solvers[11].module_name)
+        for day, solver in solvers.items():
+            self.assertEqual((2021, day), (solver.year, solver.day))
+            self.assertFalse(solver.module_name.split('.')[-1].startswith('test_'))
+
+    def test_find_solvers_missing_year(self):
+        self.assertEqual({}, registry.find_solvers(1999))
+
+    def test_get(self):
+        self.assertEqual('aoc_2022.day01', registry.get(2022, 1).module_name)
+
+    def test_get_missing_day(self):
+        with self.assertRaises(LookupError):
+            registry.get(2021, 26)
+        with self.assertRaises(LookupError):
+            registry.get(1999, 1)
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_solve_part(self):
+        solver = registry.get(2021, 1)
+        # imported afresh, so the import time is measured
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop(solver.module_name, None)
+            result = solve_part(solver, 1)
+
+        self.assertIsNone(result.error)
+        self.assertEqual((2021, 1, 1, 1184), (result.year, result.day, result.part, result.answer))
+        self.assertGreater(result.import_time, 0)
+        self.assertGreater(result.parse, 0)
+        self.assertGreater(result.solve, 0)
+        self.assertGreaterEqual(result.wall, result.import_time + result.parse + result.solve)
+
+    def test_solve_part_both(self):
+        result = solve_part(registry.get(2021, 1), 'both')
+        self.assertEqual((1184, 1158), result.answer)
+
+    def test_solve_part_error(self):
+        result = solve_part(registry.get(2021, 1), 3)
+        self.assertIsNone(result.answer)
+        self.assertIn('AttributeError', result.error)
+
+    def test_run_single_day(self):
+        results = run([(2021, 1)])
+        self.assertEqual([(1184, 1158)], [r.answer for r in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,73 +6,122 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.int_parser import to_int_ndarray
+from shared.profiling import profiled
 
 input_file = r'resources/day01_input.txt'
 
 
+@profiled
 def part1(data):
     """
     How many measurements are larger than the previous measurement?
-    :param data: list of measurements
+    Only the previous measurement is kept, so data can be any iterable, e.g. a streamed file
+    :param data: iterable of measurements
     :return: count
     """
-    count = 0
-    prev = -1
-
-    for i in range(1, len(data)):
-        current = int(data[i])
-        if current > prev:
-            count += 1
-        prev = current
-
-    return count
+    return count_window_increases(data, 1)
 
 
+@profiled
 def part2(data):
     """
     Count the number of times the sum of measurements in this sliding window increases from the previous sum.
     Start by comparing the first and second three-measurement windows.
-    :param data: list of measurements
+    Only the last three measurements are kept, so data can be any iterable.
+    :param data: iterable of measurements
     :return: count
     """
-    count = 0
-    prev_measurement_window = int(data[0]) + int(data[1]) + int(data[2])
+    return count_window_increases(data, 3)
 
-    for i in range(1, (len(data) - 2)):
-        measurement_window = int(data[i]) + int(data[i + 1]) + int(data[i + 2])
 
-        if measurement_window > prev_measurement_window:
-            count += 1
-        prev_measurement_window = measurement_window
+@profiled
+def solve(data):
+    """
+    Both parts in a single pass over the measurements
+    :param data: iterable of measurements
+    :return: (part 1 count, part 2 count)
+    """
+    count1, count2 = count_window_increases_multi(data, (1, 3))
+    return count1, count2
 
-    return count
 
+@profiled
+def part1_numpy(data):
+    """
+    As part1, vectorised with NumPy
+    :param data: NumPy array (e.g. from read_int_ndarray), list of lines or sequence of measurements
+    """
+    return count_window_increases_numpy(data, 1)
 
-class TestDay01(unittest.TestCase):
-    sample_test_data = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
 
-    def test_part1_sample_data(self):
-        result = part1(self.sample_test_data)
-        self.assertEqual(7, result)
+@profiled
+def part2_numpy(data):
+    """
+    As part2, vectorised with NumPy
+    :param data: NumPy array (e.g. from read_int_ndarray), list of lines or sequence of measurements
+    """
+    return count_window_increases_numpy(data, 3)
+
+
+@profiled
+def solve_numpy(data):
+    """
+    As solve, vectorised with NumPy, converting the data to an array once for both parts
+    """
+    depths = to_int_ndarray(data, sep=None)
+    return count_window_increases_numpy(depths, 1), count_window_increases_numpy(depths, 3)
 
-    def test_part1(self):
-        data = read_input(input_file)
 
-        result = part1(data)
-        self.assertEqual(1184, result)
+def count_window_increases_numpy(data, window_size):
+    """
+    As count_window_increases, comparing each measurement with the one window_size back as whole array operations
+    """
+    if window_size < 1:
+        raise ValueError(f'window size must be at least 1: {window_size}')
+
+    import numpy as np
+
+    depths = to_int_ndarray(data, sep=None)
+    return int(np.count_nonzero(depths[window_size:] > depths[:-window_size]))
+
+
+def count_window_increases(data, window_size):
+    """
+    Count the number of times the sum of a sliding window of measurements increases from the previous window's sum
+    :param data: iterable of measurements
+    :param window_size: number of measurements in the window
+    :return: count
+    """
+    return count_window_increases_multi(data, (window_size,))[0]
+
+
+def count_window_increases_multi(data, window_sizes):
+    """
+    Count the sliding window sum increases for several window sizes, in a single pass over the measurements.
+
+    Consecutive windows of size k share k - 1 measurements, so the sum only increases if the measurement entering
+    the window is larger than the one leaving it, k measurements back. Only the last k measurements (for the
+    largest k) are kept, in a ring buffer, so data can be a stream of any length.
+    :param data: iterable of measurements
+    :param window_sizes: sizes of the windows
+    :return: list of counts, one for each window size
+    """
+    if not window_sizes or min(window_sizes) < 1:
+        raise ValueError(f'window sizes must be at least 1: {window_sizes}')
 
-    def test_part2_sample_data(self):
-        result = part2(self.sample_test_data)
-        self.assertEqual(5, result)
+    buffer_size = max(window_sizes)
+    previous = [0] * buffer_size
+    counts = [0] * len(window_sizes)
 
-    def test_part2(self):
-        data = read_input(input_file)
+    for n, measurement in enumerate(data):
+        current = int(measurement)
+        pos = n % buffer_size
 
-        result = part2(data)
-        self.assertEqual(1158, result)
+        for i, window_size in enumerate(window_sizes):
+            if n >= window_size and current > previous[(pos - window_size) % buffer_size]:
+                counts[i] += 1
 
+        previous[pos] = current
 
-if __name__ == '__main__':
-    unittest.main()
+    return counts
@@ -6,13 +6,15 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+import os
+
+from shared.profiling import profiled
 
 
 input_file = r'resources/day02_input.txt'
 
 
+@profiled
 def part1(data):
     h_pos = 0
     depth = 0
@@ -32,6 +34,7 @@ def part1(data):
     return h_pos * depth
 
 
+@profiled
 def part2(data):
     h_pos = 0
     depth = 0
@@ -53,33 +56,175 @@ def part2(data):
     return h_pos * depth
 
 
-def __parse_instruction(ins):
-    e = ins.split(' ')
-    return e[0], int(e[1])
-
-
-class TestDay02(unittest.TestCase):
-    sample_test_data = ['forward 5', 'down 5', 'forward 8', 'up 3', 'down 8', 'forward 2']
-
-    def test_part1_sample_data(self):
-        result = part1(self.sample_test_data)
-        self.assertEqual(150, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(2073315, result)
+@profiled
+def solve(data):
+    """
+    Both parts in a single pass over the instructions. Part 1's depth is the same value as part 2's aim
+    """
+    h_pos = 0
+    depth = 0
+    aim = 0
 
-    def test_part2_sample_data(self):
-        result = part2(self.sample_test_data)
-        self.assertEqual(900, result)
+    for instruction in data:
+        direction, val = __parse_instruction(instruction)
 
-    def test_part2(self):
-        data = read_input(input_file)
+        if direction == 'forward':
+            h_pos += val
+            depth += aim * val
+        elif direction == 'down':
+            aim += val
+        elif direction == 'up':
+            aim -= val
+        else:
+            raise Exception("Invalid direction:", direction)
 
-        result = part2(data)
-        self.assertEqual(1840311528, result)
+    return h_pos * aim, h_pos * depth
+
+
+@profiled
+def part1_numpy(data):
+    """
+    As part1, vectorised with NumPy: the horizontal position and depth are just sums of the moves
+    """
+    forward, aim_changes = __encode_numpy(data)
+    return int(forward.sum()) * int(aim_changes.sum())
+
+
+@profiled
+def part2_numpy(data):
+    """
+    As part2, vectorised with NumPy
+    """
+    import numpy as np
+
+    forward, aim_changes = __encode_numpy(data)
+    return int(forward.sum()) * int(np.dot(np.cumsum(aim_changes), forward))
+
+
+@profiled
+def solve_numpy(data):
+    """
+    As solve, vectorised with NumPy. The instructions are parsed into command and value arrays in one go, the aim at
+    each instruction is the cumulative sum of the downs less the ups and the depth is that aim dotted with the
+    forward moves. Values are 64 bit, so the depth must fit in an int64
+    :param data: list of instruction lines
+    :return: (part 1, part 2)
+    """
+    import numpy as np
+
+    forward, aim_changes = __encode_numpy(data)
+    aim = np.cumsum(aim_changes)
+
+    h_pos = int(forward.sum())
+    return h_pos * int(aim[-1] if len(aim) else 0), h_pos * int(np.dot(aim, forward))
+
+
+def __encode_numpy(data):
+    """The instructions as arrays of each forward move, and each change in aim (downs less ups), 0 elsewhere"""
+    import warnings
+    import numpy as np
+
+    # encode the commands as 0, 1, 2 so the whole text parses as one int array
+    text = ' '.join(data).replace('forward', '0').replace('down', '1').replace('up', '2')
+    with warnings.catch_warnings():
+        # NumPy only warns, stopping early, when the text has something other than numbers left
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            tokens = np.fromstring(text, dtype=np.int64, sep=' ').reshape(-1, 2)
+        except (DeprecationWarning, ValueError):
+            raise Exception("Invalid direction in instructions") from None
+    commands = tokens[:, 0]
+    values = tokens[:, 1]
+
+    is_forward = commands == 0
+    is_down = commands == 1
+    is_up = commands == 2
+    if not (is_forward | is_down | is_up).all():
+        raise Exception("Invalid direction:", int(commands[~(is_forward | is_down | is_up)][0]))
+
+    forward = np.where(is_forward, values, 0)
+    aim_changes = np.where(is_down, values, 0) - np.where(is_up, values, 0)
+    return forward, aim_changes
+
+
+def solve_file_parallel(filename, processes=None, chunks=None):
+    """
+    Both parts for a (very large) instruction file, using every core.
+    Each instruction is an affine update of (aim, h_pos, depth), so a run of instructions composes to a single
+    (aim, h_pos, depth) transform. The file is split into byte ranges, each range is reduced to its transform in a
+    worker process and the transforms are combined in file order, giving exactly the sequential answer.
+    :param filename: the instruction file
+    :param processes: number of worker processes, defaults to the number of cores
+    :param chunks: number of byte ranges to split the file into, defaults to the number of processes
+    :return: (part 1, part 2)
+    """
+    # deferred to here, keeping it off the import path of the module
+    from concurrent.futures import ProcessPoolExecutor
+
+    processes = processes or os.cpu_count() or 1
+    chunks = chunks or processes
+    size = os.path.getsize(filename)
+    bounds = [size * i // chunks for i in range(chunks + 1)]
+    ranges = [(filename, start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+    aim = h_pos = depth = 0
+    if processes == 1:
+        partials = [reduce_range(*r) for r in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            partials = list(pool.map(reduce_range, *zip(*ranges)))
+
+    for partial in partials:
+        aim, h_pos, depth = combine((aim, h_pos, depth), partial)
+
+    return h_pos * aim, h_pos * depth
+
+
+def combine(first, second):
+    """
+    Compose two (aim, h_pos, depth) transforms, first then second. The second's forward moves happen with the
+    first's aim added to their own, adding first aim * second h_pos to the depth.
+    """
+    a1, h1, d1 = first
+    a2, h2, d2 = second
+    return a1 + a2, h1 + h2, d1 + d2 + a1 * h2
+
+
+def reduce_range(filename, start, end):
+    """
+    Reduce the instructions in the byte range [start, end) of a file to an (aim, h_pos, depth) transform, starting
+    from an aim of 0. A line belongs to the range it starts in, so ranges don't need to be aligned to newlines.
+    """
+    aim = h_pos = depth = 0
+
+    with open(filename, 'rb') as file:
+        if start:
+            # skip the line that started in the previous range
+            file.seek(start - 1)
+            file.readline()
+
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            e = line.split()
+            if not e:
+                continue
+
+            direction, val = e[0], int(e[1])
+            if direction == b'forward':
+                h_pos += val
+                depth += aim * val
+            elif direction == b'down':
+                aim += val
+            elif direction == b'up':
+                aim -= val
+            else:
+                raise Exception("Invalid direction:", direction.decode())
+
+    return aim, h_pos, depth
 
 
-if __name__ == '__main__':
-    unittest.main()
+def __parse_instruction(ins):
+    e = ins.split(' ')
+    return e[0], int(e[1])
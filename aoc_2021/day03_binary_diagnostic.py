@@ -6,128 +6,104 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from bisect import bisect_left
+
+from shared.profiling import profiled
 
 
 input_file = r'resources/day03_input.txt'
 
 
+@profiled
 def part1(data):
-    bits_0, bits_1 = __sum_bits(data)
-
-    gamma_binary_str = ''
-    epsilon_binary_str = ''
-
-    for i in range(len(data[0])):
-        if bits_0[i] > bits_1[i]:
-            gamma_binary_str += '0'
-            epsilon_binary_str += '1'
-        else:
-            gamma_binary_str += '1'
-            epsilon_binary_str += '0'
-
-    return int(gamma_binary_str, 2) * int(epsilon_binary_str, 2)
-
-
-def __sum_bits(data):
-    bits_0 = {}
-    bits_1 = {}
-
-    for number in data:
-        for i, bit in enumerate(number):
-            bits_0.setdefault(i, 0)
-            bits_1.setdefault(i, 0)
-
-            if bit == '0':
-                bits_0[i] += 1
-            else:
-                bits_1[i] += 1
-
-    return bits_0, bits_1
+    data = __report_lines(data)
+    return __power_consumption(__count_ones(data), len(data))
 
 
+@profiled
 def part2(data):
-    o2_rating = __find_oxygen_generator_rating(list(data))
-    co2_rating = __find_co2_scrub_rating(list(data))
-
-    return int(o2_rating, 2) * int(co2_rating, 2)
-
-
-def __get_most_common_bit(bits_0, bits_1, numbers):
-    binary = ''
-    for i in range(len(numbers[0])):
-        if bits_0[i] > bits_1[i]:
-            binary += '0'
+    return __life_support_rating(__parse_report(__report_lines(data)))
+
+
+@profiled
+def solve(data):
+    """
+    Both parts from one copy of the report
+    :return: (power consumption, life support rating)
+    """
+    data = __report_lines(data)
+    return __power_consumption(__count_ones(data), len(data)), __life_support_rating(__parse_report(data))
+
+
+def __report_lines(data):
+    """The report's numbers, zero padded to the same width if they aren't already"""
+    data = [line.strip() for line in data if line.strip()]
+    width = max(map(len, data), default=0)
+    if any(len(number) != width for number in data):
+        data = [number.zfill(width) for number in data]
+    return data
+
+
+def __count_ones(data):
+    """Number of 1 bits in each column, most significant first, counted over strided slices of the joined report"""
+    if not data:
+        return []
+    width = len(data[0])
+    report = ''.join(data)
+    return [report[i::width].count('1') for i in range(width)]
+
+
+def __power_consumption(ones, count):
+    """gamma has a 1 wherever 1 is the most common bit (or as common as 0), epsilon is its complement"""
+    gamma = 0
+    for column_ones in ones:
+        gamma = (gamma << 1) | (column_ones * 2 >= count)
+    epsilon = gamma ^ ((1 << len(ones)) - 1)
+    return gamma * epsilon
+
+
+def __parse_report(data):
+    """The report as sorted ints, and the bit width"""
+    return sorted(int(number, 2) for number in data), len(data[0]) if data else 0
+
+
+def __life_support_rating(report):
+    numbers, width = report
+    return __find_rating(numbers, width, False) * __find_rating(numbers, width, True)
+
+
+def __find_rating(numbers, width, least_common):
+    """
+    Narrow the range of sorted numbers sharing the bits chosen so far, from the most significant bit down.
+    Within the range, the numbers with the next bit 0 all come before those with it 1, so a binary search splits the
+    range in two, O(width * log n) per rating.
+    Keeps the most common bit (1 if equally common), or the least common bit (0 if equally common). A bit every
+    number in the range shares is kept either way
+    """
+    lo, hi = 0, len(numbers)
+    prefix = 0
+
+    for bit in reversed(range(width)):
+        if hi - lo <= 1:
+            break
+
+        split = bisect_left(numbers, prefix | (1 << bit), lo, hi)
+        zeros = split - lo
+        ones = hi - split
+
+        if zeros == 0 or ones == 0:
+            keep_ones = ones > 0
+        elif least_common:
+            keep_ones = ones < zeros
         else:
-            binary += '1'
-    return binary
-
-
-def __find_oxygen_generator_rating(data):
-    return __find_rating(data, __get_common_bit, False)
-
-
-def __find_co2_scrub_rating(data):
-    return __find_rating(data, __get_common_bit, True)
-
-
-def __find_rating(data, bit_calculation, least_common):
-    for i in range(len(data[0])):
-        temp_data = list(data)
-        bit = bit_calculation(temp_data, i, least_common)
-
-        for number in list(data):
-            if number[i] != bit:
-                data.remove(number)
-
-            if len(data) == 1:
-                return data[0]
-    return None
-
-
-def __get_common_bit(numbers, pos, least_common=False):
-    zeros = 0
-    ones = 0
-
-    for number in numbers:
-        if number[pos] == '0':
-            zeros += 1
-        if number[pos] == '1':
-            ones += 1
-
-    if least_common:
-        if zeros == ones or ones > zeros:
-            return '1'
-    else:
-        if zeros != ones and ones < zeros:
-            return '1'
-
-    return '0'
-
-
-class TestDay03(unittest.TestCase):
-    sample_test_data = ['00100', '11110', '10110', '10111', '10101', '01111', '00111', '11100', '10000', '11001',
-                        '00010', '01010']
-
-    def test_part1_sample_data(self):
-        result = part1(self.sample_test_data)
-        self.assertEqual(198, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(3895776, result)
-
-    def test_part2_sample_data(self):
-        result = part2(self.sample_test_data)
-        self.assertEqual(230, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(7928162, result)
+            keep_ones = ones >= zeros
 
+        if keep_ones:
+            lo = split
+            prefix |= 1 << bit
+        else:
+            hi = split
 
-if __name__ == '__main__':
-    unittest.main()
+    if lo == hi:
+        raise ValueError('no numbers in the diagnostic report')
+    return numbers[lo]
@@ -6,160 +6,241 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from array import array
+from itertools import chain
+
+from shared.parse_cache import cached_parser
+from shared.metrics import counter
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day04_input.txt'
 test_data_input_file = r'resources/day04_test_input.txt'
 
+cells_marked = counter('aoc_2021_day04_cells_marked_total', 'Board cells marked by a called number')
+
 
+@profiled
 def part1(data):
     """
     Bingo! Input contains the bingo boards and list of numbers called. Find the board that has a winning line
-    A brute force approach on this one. No issues as dataset is small enough to get a result.
     """
-    boards = __create_boards(data)
-    numbers = map(int, data[0].split(','))
-
-    for number in numbers:
-        for board in boards:
-            if __update(number, board):
-                return __calc_board_result(board, number)
-    return -1
+    wins = play(data, stop_after_first=True)
+    return wins[0][2] if wins else -1
 
 
+@profiled
 def part2(data):
     """
     Find the board that wins last!
-    A brute force approach on this one. No issues as dataset is small enough to get a result.
+    """
+    wins = play(data)
+    return wins[-1][2] if wins else -1
+
+
+@profiled
+def solve(data):
+    """
+    Both parts from a single game: the first board to win is part 1, the last part 2
+    """
+    wins = play(data)
+    if not wins:
+        return -1, -1
+    return wins[0][2], wins[-1][2]
+
+
+def play(data, stop_after_first=False):
+    """
+    Play the game to the end, in the order the boards win.
+    Every cell of every board is indexed by its number once, so calling a number only touches the cells with that
+    number. Each board keeps a count of the marked cells in each row and column, and the sum of its unmarked cells.
+    :param data: the numbers called, then the boards
+    :param stop_after_first: stop once a board has won
+    :return: list of (board index, winning number, score) in the order the boards won
     """
     boards = __create_boards(data)
     numbers = map(int, data[0].split(','))
+    return __play(numbers, boards, stop_after_first)
+
+
+@phase('solve')
+def __play(numbers, boards, stop_after_first):
+    if not boards:
+        return []
+
+    rows = len(boards[0])
+    cols = len(boards[0][0])
+    cells = rows * cols
+
+    # number -> cells with that number, a cell being board * cells + row * cols + col
+    index = {}
+    unmarked = array('q', bytes(8 * len(boards)))
+    for b, board in enumerate(boards):
+        unmarked[b] = sum(map(sum, board))
+        for cell, n in enumerate(chain.from_iterable(board), b * cells):
+            index.setdefault(n, []).append(cell)
 
-    winners = []
+    row_hits = array('H', bytes(2 * rows * len(boards)))
+    col_hits = array('H', bytes(2 * cols * len(boards)))
+    won = bytearray(len(boards))
+    wins = []
 
     for number in numbers:
-        for i, board in enumerate(boards):
-            if i not in winners:
-                if __update(number, board):
-                    winners.append(i)
-                    if len(winners) == len(boards):
-                        return __calc_board_result(board, number)
-    return -1
+        # pop, so a number called again doesn't mark its cells twice
+        found = index.pop(number, ())
+
+        for cell in found:
+            b, offset = divmod(cell, cells)
+            if won[b]:
+                continue
+            cells_marked.inc()
+            r, c = divmod(offset, cols)
+            unmarked[b] -= number
+
+            row = b * rows + r
+            row_hits[row] += 1
+            col = b * cols + c
+            col_hits[col] += 1
+
+            if row_hits[row] == cols or col_hits[col] == rows:
+                won[b] = 1
+                wins.append((b, number, unmarked[b] * number))
+                if stop_after_first or len(wins) == len(boards):
+                    return wins
+
+    return wins
+
+
+@profiled
+def part1_numpy(data):
+    """
+    As part1, vectorised with NumPy
+    """
+    called, boards, turns, win_turns = __win_turns_numpy(data)
+    board = __first_winner_numpy(win_turns, len(called))
+    return -1 if board is None else __score_numpy(called, boards, turns, win_turns, board)
 
 
-def __calc_board_result(board, winning_num):
+@profiled
+def part2_numpy(data):
     """
-    Find the sum of all unmarked numbers on the board
-    :param board: bingo board
-    :param winning_num: winning number
-    :return: sum of unmarked numbers * the winning number
+    As part2, vectorised with NumPy
     """
-    unmarked = 0
+    called, boards, turns, win_turns = __win_turns_numpy(data)
+    board = __last_winner_numpy(win_turns, len(called))
+    return -1 if board is None else __score_numpy(called, boards, turns, win_turns, board)
 
-    for line in board:
-        for number in line:
-            if number[1] != 'x':
-                unmarked += int(number[0])
 
-    return unmarked * winning_num
+@profiled
+def solve_numpy(data):
+    """
+    As solve, vectorised with NumPy
+    """
+    called, boards, turns, win_turns = __win_turns_numpy(data)
+    first = __first_winner_numpy(win_turns, len(called))
+    if first is None:
+        return -1, -1
+    last = __last_winner_numpy(win_turns, len(called))
+    return (__score_numpy(called, boards, turns, win_turns, first),
+            __score_numpy(called, boards, turns, win_turns, last))
 
 
-def __update(n, board):
+def play_numpy(data):
     """
-    Update the board by marking off the number n.
-    Check if there is a winning line (vertical or horizontal).
-    :param n: number
-    :param board: board to check
-    :return: True if a winning line, otherwise False
+    As play, without simulating the game. Each number is replaced by the turn it is called on, then a line is complete
+    on the turn of its latest number and a board wins on the turn of its earliest complete row or column, so all the
+    boards are solved as whole array operations whatever the number of calls.
+    Boards winning on the same turn win in board order, as they do in play.
+    :return: list of (board index, winning number, score) in the order the boards won
     """
-    
-    # TODO: Function way too big and messy!
-    
-    # Scan each board and look for the number to mark off
-    row_len = len(board[0])
+    import numpy as np
 
-    done = False
-    for line_no, line in enumerate(board):
-        for col_no, number in enumerate(line):
-            if number[0] == int(n):
-                number[1] = 'x'
-                done = True
-                break
-        if done:
-            break
+    called, boards, turns, win_turns = __win_turns_numpy(data)
+    if not len(boards):
+        return []
 
-    # check if the line is a horizontal winner
-    candidate_row = board[line_no]
-    count = 0
-    for number in candidate_row:
-        if number[1] == 'x':
-            count += 1
+    unmarked = np.where(turns > win_turns[:, None, None], boards, 0).sum(axis=(1, 2))
 
-    if count == row_len:
-        return True
+    order = np.argsort(win_turns, kind='stable')
+    order = order[win_turns[order] < len(called)]
+    winning_numbers = called[win_turns[order]]
+    return [(int(b), int(n), int(unmarked[b] * n)) for b, n in zip(order, winning_numbers)]
 
-    # check if the line is a vertical winner
-    count = 0
-    candidate_col = col_no
 
-    for r in range(row_len):
-        row = board[r]
-        if row[candidate_col][1] == 'x':
-            count += 1
+def __win_turns_numpy(data):
+    """
+    The numbers called, the boards, the turn each board number is called on and the turn each board wins on.
+    Numbers never called, and boards that never win, have the turn after the last
+    """
+    import numpy as np
 
-    if count == row_len:
-        return True
+    called = np.array(data[0].split(','), dtype=np.int64)
+    boards = __read_boards_numpy(data)
+    if not len(boards):
+        return called, boards, boards, np.zeros(0, dtype=np.int64)
 
-    return False
+    # the turn each number is first called on
+    size = int(max(called.max(initial=0), boards.max())) + 1
+    turn_called = np.full(size, len(called), dtype=np.int64)
+    numbers, first_turns = np.unique(called, return_index=True)
+    turn_called[numbers] = first_turns
 
+    turns = turn_called[boards]
+    win_turns = np.minimum(turns.max(axis=2).min(axis=1), turns.max(axis=1).min(axis=1))
+    return called, boards, turns, win_turns
 
-def __create_boards(data):
-    boards = []
-    board = []
-    for input in data[2:]:
 
-        if len(input) == 0:
-            boards.append(board)
-            board = []
-            continue
+def __first_winner_numpy(win_turns, never):
+    # argmin takes the first of the boards winning on the same turn
+    if not len(win_turns):
+        return None
+    board = int(win_turns.argmin())
+    return board if win_turns[board] < never else None
 
-        nums = input.split(' ')
 
-        line = []
-        for n in nums:
-            if n != '':
-                line.append([int(n), '0'])
+def __last_winner_numpy(win_turns, never):
+    # the last of the boards winning on the latest turn
+    import numpy as np
 
-        board.append(line)
+    turns = np.where(win_turns < never, win_turns, -1)
+    if not len(turns) or turns.max() < 0:
+        return None
+    return len(turns) - 1 - int(turns[::-1].argmax())
 
-    boards.append(board)
-    return boards
 
+def __score_numpy(called, boards, turns, win_turns, board):
+    number = int(called[win_turns[board]])
+    return int(boards[board][turns[board] > win_turns[board]].sum()) * number
 
-class TestDay04(unittest.TestCase):
 
-    def test_part1_sample_data(self):
-        data = read_input(test_data_input_file)
-        result = part1(data)
-        self.assertEqual(4512, result)
+def __read_boards_numpy(data):
+    """All the boards as one (boards, rows, cols) array, parsed in bulk"""
+    import numpy as np
 
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(31424, result)
+    lines = [line for line in data[2:] if line.strip()]
+    if not lines:
+        return np.zeros((0, 0, 0), dtype=np.int64)
 
-    def test_part2_sample_data(self):
-        data = read_input(test_data_input_file)
-        result = part2(data)
-        self.assertEqual(1924, result)
+    cols = len(lines[0].split())
+    rows = next((i for i, line in enumerate(data[2:]) if not line.strip()), len(data) - 2)
+    return np.fromstring(' '.join(lines), dtype=np.int64, sep=' ').reshape(-1, rows, cols)
 
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(23042, result)
 
+@phase('parse')
+@cached_parser(version=2)
+def __create_boards(data):
+    boards = []
+    board = []
+    for input in data[2:]:
 
-if __name__ == '__main__':
-    unittest.main()
+        if len(input.strip()) == 0:
+            if board:
+                boards.append(board)
+            board = []
+            continue
+
+        board.append(list(map(int, input.split())))
+
+    if board:
+        boards.append(board)
+    return boards
@@ -6,36 +6,49 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
+from shared.int_parser import parse_ints
+from shared.profiling import profiled
+
+
+input_file = r'resources/day06_input.txt'
+
 
 class SpawnManager:
+    """
+    The school of fish, held as the number of fish at each timer value rather than an object per fish, so the memory
+    used doesn't grow with the school. The counts are a ring: a day moves the start on by one instead of moving the
+    counts, and the fish that were at timer 0 become the newborns at timer 8 where they are.
+    """
     def __init__(self, timers):
-        self.fish = []
+        self.counts = [0] * 9
+        # index in counts of timer 0
+        self.start = 0
         for t in timers:
-            self.fish.append(Fish(int(t)))
+            t = int(t)
+            if not 0 <= t <= 8:
+                raise ValueError(f'timers must be between 0 and 8: {t}')
+            self.counts[t] += 1
 
     def update(self):
-        for f in list(self.fish):
-            f.timer -= 1
+        breeding = self.counts[self.start]
+        self.start = (self.start + 1) % 9
+        self.counts[(self.start + 6) % 9] += breeding
 
-            if f.timer < 0:
-                f.timer = 6
-                self.fish.append(Fish(8))
+    def total(self):
+        """Number of fish, which unlike len() can be more than sys.maxsize"""
+        return sum(self.counts)
 
     def __len__(self):
-        return len(self.fish)
-
-
-class Fish:
-    def __init__(self, timer):
-        self.timer = timer
+        # len() raises OverflowError beyond sys.maxsize, around 440 days from a few hundred fish
+        return self.total()
 
 
+@profiled
 def part1(data):
     """
-    Brute Force Solution modelled using OO - Fine for small datasets, but grows exponentially
+    Simulated with the SpawnManager, a day at a time
     """
-    timers = data.split(',')
+    timers = parse_ints(data)
     spawner = SpawnManager(timers)
 
     for _ in range(80):
@@ -44,55 +57,163 @@ def part1(data):
     return len(spawner)
 
 
+@profiled
 def part2(data):
     """
-    Brute Force Solution won't work here as the data set is too large and grows exponentially over too many days
-    The list grows with each cycle, so need a way to stop that happening.
-    
-    Also, swapped OO for a more direct and simple approach using a list
+    Brute Force Solution won't work here as the data set is too large and grows exponentially over too many days.
+    Fish are counted by their timer instead, see population
     """
+    return population(parse_ints(data), 256)
+
 
-    timers = list(map(int, data.split(',')))
+@profiled
+def solve(data):
+    """
+    Both parts from one run of the population engine, taking the number of fish after day 80 on the way to day 256
+    """
+    after_80_days, after_256_days = populations(parse_ints(data), (80, 256))
+    return after_80_days, after_256_days
 
-    # Dont store fish, but store a list of the number of fish at each state, as fish get state zero these can
-    # be popped off the list, and a state 8 added
-    # Here the list doesn't grow, so space complexity is O(1), meaning a very quick execution time
-    # After all the cycles, simply add up the number of fish at each state to get the answer
+
+def population(timers, days, modulus=None):
+    """
+    Number of fish after the given number of days
+    :param timers: the starting fish's timers
+    :param days: number of days
+    :param modulus: if given, the number of fish modulo this. Without it the count has about days / 11 digits, so a
+    modulus is needed for something like 10^12 days
+    """
+    return populations(timers, (days,), modulus)[0]
+
+
+def populations(timers, horizons, modulus=None):
+    """
+    Number of fish after each of a number of days.
+    The fish are counted by their timer, and a day moves the counts on by multiplying by a 9 x 9 transition matrix.
+    Advancing n days multiplies by the matrices for the powers of two making up n, squared once and cached, so the
+    horizons are answered in order in O(log days) steps each.
+    :param timers: the starting fish's timers
+    :param horizons: numbers of days
+    :param modulus: if given, the numbers of fish modulo this
+    :return: list of the number of fish for each horizon, in the order given
+    """
     state = [0] * 9
-    for fish_to_breed in timers:
-        state[fish_to_breed] += 1
+    for timer in timers:
+        state[timer] += 1
+
+    if modulus:
+        state = [n % modulus for n in state]
+
+    results = {}
+    day = 0
+    for horizon in sorted(set(horizons)):
+        if horizon < 0:
+            raise ValueError(f'days must not be negative: {horizon}')
+
+        state = __advance(state, horizon - day, modulus)
+        day = horizon
+        results[horizon] = sum(state) % modulus if modulus else sum(state)
+
+    return [results[horizon] for horizon in horizons]
+
+
+@profiled
+def solve_numpy(data):
+    """
+    As solve, with the batch simulator for a batch of one school
+    """
+    after_80_days, after_256_days = populations_numpy([parse_ints(data)], (80, 256))[:, 0]
+    return int(after_80_days), int(after_256_days)
+
+
+def populations_numpy(schools, horizons, reset=6, newborn=8, dtype=None):
+    """
+    Number of fish in each of a number of independent schools after each of a number of days, simulated a day at
+    a time for all the schools at once. Each school is a row of counts by timer, so a day is a shift of the whole
+    array one timer down, with each school's breeding fish added back at its reset and newborn timers.
+    :param schools: list of lists of the starting fish's timers, one per school
+    :param horizons: numbers of days
+    :param reset: timer of a fish after it breeds, one for all schools or one per school
+    :param newborn: timer of a new fish, one for all schools or one per school
+    :param dtype: NumPy dtype of the counts, int64 by default. This overflows after a few hundred days, object
+    gives exact counts of any size
+    :return: array of (horizons, schools) fish counts, horizons in the order given
+    """
+    import numpy as np
+
+    schools = [np.asarray(timers, dtype=np.int64) for timers in schools]
+    count = len(schools)
+    reset = np.broadcast_to(np.asarray(reset, dtype=np.int64), (count,))
+    newborn = np.broadcast_to(np.asarray(newborn, dtype=np.int64), (count,))
+
+    timers = np.concatenate(schools) if schools else np.zeros(0, dtype=np.int64)
+    if (timers < 0).any() or (reset < 0).any() or (newborn < 0).any():
+        raise ValueError('timers must not be negative')
+    horizons = np.asarray(horizons, dtype=np.int64)
+    if (horizons < 0).any():
+        raise ValueError('days must not be negative')
+
+    width = int(max(timers.max(initial=0), reset.max(initial=0), newborn.max(initial=0))) + 1
+    school = np.repeat(np.arange(count), [len(timers) for timers in schools])
+    counts = np.bincount(school * width + timers, minlength=count * width).reshape(count, width)
+    counts = counts.astype(dtype or np.int64)
+
+    rows = np.arange(count)
+    results = np.zeros((len(horizons), count), dtype=counts.dtype)
+    days = int(horizons.max(initial=0))
+
+    for day in range(days + 1):
+        if day:
+            breeding = counts[:, 0].copy()
+            counts[:, :-1] = counts[:, 1:]
+            counts[:, -1] = 0
+            counts[rows, reset] += breeding
+            counts[rows, newborn] += breeding
+
+        results[horizons == day] = counts.sum(axis=1)
+
+    return results
+
+
+# the transition matrix raised to 1, 2, 4, 8... for each modulus, squared as needed
+__transition_powers = {}
 
-    for day in range(256):
-        # remove all fish with zero timer
-        breeding = state.pop(0)
-        # add all fish with timer reset
-        state[-2] += breeding
-        # add back to the list
-        state.append(breeding)
 
-    return sum(state)
+def __transition():
+    """The counts for a day: each timer's count moves down one, and timer 0's go to both 6 and 8"""
+    matrix = [[0] * 9 for _ in range(9)]
+    for timer in range(8):
+        matrix[timer][timer + 1] = 1
+    matrix[6][0] = 1
+    matrix[8][0] = 1
+    return matrix
 
 
-class TestDay06(unittest.TestCase):
-    sample_test_data = '3, 4, 3, 1, 2'
-    input_data = '1,3,1,5,5,1,1,1,5,1,1,1,3,1,1,4,3,1,1,2,2,4,2,1,3,3,2,4,4,4,1,3,1,1,4,3,1,5,5,1,1,3,4,2,1,5,3,4,5,5,2,5,5,1,5,5,2,1,5,1,1,2,1,1,1,4,4,1,3,3,1,5,4,4,3,4,3,3,1,1,3,4,1,5,5,2,5,2,2,4,1,2,5,2,1,2,5,4,1,1,1,1,1,4,1,1,3,1,5,2,5,1,3,1,5,3,3,2,2,1,5,1,1,1,2,1,1,2,1,1,2,1,5,3,5,2,5,2,2,2,1,1,1,5,5,2,2,1,1,3,4,1,1,3,1,3,5,1,4,1,4,1,3,1,4,1,1,1,1,2,1,4,5,4,5,5,2,1,3,1,4,2,5,1,1,3,5,2,1,2,2,5,1,2,2,4,5,2,1,1,1,1,2,2,3,1,5,5,5,3,2,4,2,4,1,5,3,1,4,4,2,4,2,2,4,4,4,4,1,3,4,3,2,1,3,5,3,1,5,5,4,1,5,1,2,4,2,5,4,1,3,3,1,4,1,3,3,3,1,3,1,1,1,1,4,1,2,3,1,3,3,5,2,3,1,1,1,5,5,4,1,2,3,1,3,1,1,4,1,3,2,2,1,1,1,3,4,3,1,3'
+def __advance(state, days, modulus):
+    powers = __transition_powers.setdefault(modulus, [__transition()])
 
-    def test_part1_sample_data(self):
-        result = part1(self.sample_test_data)
-        self.assertEqual(5934, result)
+    bit = 0
+    while days:
+        if bit == len(powers):
+            powers.append(__multiply(powers[-1], powers[-1], modulus))
+        if days & 1:
+            state = __apply(powers[bit], state, modulus)
+        days >>= 1
+        bit += 1
 
-    def test_part1(self):
-        result = part1(self.input_data)
-        self.assertEqual(360268, result)
+    return state
 
-    def test_part2_sample_data(self):
-        result = part2(self.sample_test_data)
-        self.assertEqual(26984457539, result)
 
-    def test_part2(self):
-        result = part2(self.input_data)
-        self.assertEqual(1632146183902, result)
+def __multiply(a, b, modulus):
+    columns = list(zip(*b))
+    product = [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+    if modulus:
+        product = [[n % modulus for n in row] for row in product]
+    return product
 
 
-if __name__ == '__main__':
-    unittest.main()
+def __apply(matrix, state, modulus):
+    state = [sum(x * y for x, y in zip(row, state)) for row in matrix]
+    if modulus:
+        state = [n % modulus for n in state]
+    return state
@@ -6,78 +6,235 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import sys
-import unittest
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
 
+from shared.int_parser import parse_ints, to_int_ndarray
+from shared.profiling import profiled
 
+
+input_file = r'resources/day07_input.txt'
+
+
+class FuelCosts:
+    """
+    The fuel for all the crabs to align on any target position, exactly, in O(log n) for n distinct positions.
+    The crabs are counted by position, with running totals of the counts and of the positions over the sorted
+    positions, so the crabs either side of a target and the sum of their positions are found with a binary search.
+    Memory is in proportion to the number of distinct positions, not the range of them.
+    """
+    def __init__(self, positions):
+        counts = Counter(positions)
+        if not counts:
+            raise ValueError('no crab positions')
+
+        self.positions = sorted(counts)
+        # crabs, and the sum of their positions, at or before each position
+        self.crabs_to = list(accumulate(counts[p] for p in self.positions))
+        self.totals_to = list(accumulate(p * counts[p] for p in self.positions))
+
+        self.crabs = self.crabs_to[-1]
+        self.total = self.totals_to[-1]
+        self.squares_total = sum(p * p * counts[p] for p in self.positions)
+
+    def linear(self, target):
+        """Fuel when each step costs 1: the sum of the distances to the target"""
+        i = bisect_right(self.positions, target)
+        crabs_before = self.crabs_to[i - 1] if i else 0
+        total_before = self.totals_to[i - 1] if i else 0
+
+        return (target * crabs_before - total_before) + \
+            (self.total - total_before) - target * (self.crabs - crabs_before)
+
+    def triangular(self, target):
+        """
+        Fuel when each step costs one more than the last: d * (d + 1) / 2 for each distance d. The sum of the
+        squared distances expands to terms of the totals of the positions and their squares
+        """
+        squares = self.squares_total - 2 * target * self.total + self.crabs * target * target
+        return (squares + self.linear(target)) // 2
+
+    def best_linear(self):
+        """The median is the cheapest target for linear costs: moving away from it has more crabs behind than ahead"""
+        median = self.positions[bisect_right(self.crabs_to, (self.crabs - 1) // 2)]
+        return median, self.linear(median)
+
+    def best_triangular(self):
+        """
+        The cheapest target for triangular costs is within half a step of the mean, so the cheapest whole position
+        is one of the whole numbers around it
+        """
+        mean = self.total // self.crabs
+        return min(((target, self.triangular(target)) for target in range(mean - 1, mean + 3)),
+                   key=lambda cost: cost[1])
+
+
+@profiled
 def part1(data):
     """
-    Brute Force: Calculate the cost of aligning at each position, keeping track of the lowest cost.
-    Inefficient at scale, but fine for a quick (in terms of implementing) solution for this data set
+    The cheapest target is the crabs' median position
+    """
+    return FuelCosts(parse_ints(data)).best_linear()[1]
+
+
+@profiled
+def part2(data):
+    """
+    The cheapest target is next to the crabs' mean position
     """
-    positions = list(map(int, data.split(',')))
+    return FuelCosts(parse_ints(data)).best_triangular()[1]
 
-    # Find the first and last numbers to get the full range of possible 'locations'
-    positions.sort()
-    start = positions[0]
-    end = positions[-1]
 
-    min_cost = sys.maxsize
+@profiled
+def solve(data):
+    """
+    Both parts from the one set of fuel costs
+    """
+    costs = FuelCosts(parse_ints(data))
+    return costs.best_linear()[1], costs.best_triangular()[1]
 
-    for target_pos in range(start, end):
-        cost = 0
-        for pos in positions:
-            cost += abs(target_pos - pos)
-        min_cost = min(min_cost, cost)
 
-    return min_cost
+def linear_cost(distance):
+    """Fuel for a distance when each step costs 1"""
+    return distance
 
 
-def part2(data):
+def triangular_cost(distance):
+    """Fuel for a distance when each step costs one more than the last"""
+    return distance * (distance + 1) // 2
+
+
+@profiled
+def part1_numpy(data):
     """
-    Brute Force: Calculate the cost of aligning at each position, keeping track of the lowest cost.
-    Inefficient at scale, but fine for a quick (in terms of implementing) solution for this data set
+    As part1, with NumPy, by a ternary search of the costs
     """
-    positions = list(map(int, data.split(',')))
+    return best_target_convex_numpy(to_int_ndarray(data), linear_cost)[1]
+
+
+@profiled
+def part2_numpy(data):
+    """
+    As part2, with NumPy, by a ternary search of the costs
+    """
+    return best_target_convex_numpy(to_int_ndarray(data), triangular_cost)[1]
+
+
+@profiled
+def solve_numpy(data):
+    """
+    As solve, with NumPy, by a ternary search of the costs
+    """
+    positions = to_int_ndarray(data)
+    return best_target_convex_numpy(positions, linear_cost)[1], best_target_convex_numpy(positions, triangular_cost)[1]
+
+
+def cost_curve_numpy(positions, kernel, weights=None):
+    """
+    The cost of aligning on every target between the lowest and highest positions, for any cost of a distance.
+    The crabs are counted by position (or their weights summed), then the curve is that histogram convolved with the
+    cost of each distance either way, O(r^2) for a range of r positions.
+    Costs are int64 for int kernels and weights, or Python ints if they could be too big for an int64, and floats
+    otherwise.
+    :param positions: crab positions
+    :param kernel: cost of a crab moving a distance, called with an array of distances
+    :param weights: weight of each crab, 1 by default
+    :return: (target with the lowest cost, lowest cost, array of the cost of each target from the lowest position)
+    """
+    import numpy as np
+
+    positions = np.asarray(positions, dtype=np.int64)
+    if not len(positions):
+        raise ValueError('no crab positions')
+
+    low = int(positions.min())
+    span = int(positions.max()) - low + 1
+    distances = np.abs(np.arange(-(span - 1), span, dtype=np.int64))
+
+    costs = np.asarray(kernel(distances))
+    if not __integer_costs(costs, weights):
+        histogram = np.bincount(positions - low, weights=weights, minlength=span)
+    else:
+        # worked out exactly, to see if the costs fit in an int64
+        costs = np.asarray(kernel(distances.astype(object)))
+        dtype = __cost_dtype(max(abs(c) for c in costs), positions, weights)
+        costs = costs.astype(dtype)
+        if weights is None:
+            histogram = np.bincount(positions - low, minlength=span).astype(dtype)
+        else:
+            histogram = np.zeros(span, dtype=dtype)
+            np.add.at(histogram, positions - low, np.asarray(weights).astype(dtype))
+
+    curve = np.convolve(histogram, costs, mode='valid')
+
+    best = int(np.argmin(curve))
+    return low + best, __to_python(curve[best]), curve
+
+
+def best_target_convex_numpy(positions, kernel, weights=None):
+    """
+    The cheapest target when the cost of a distance is convex, making the total cost convex in the target, by a
+    ternary search of the range of positions. Each step costs one vectorised evaluation over the crabs, so it takes
+    O(n log r) for n crabs over a range of r positions.
+    Equal costs either side narrow the search to between them, where a convex function's minimum must be.
+    Costs are int64 for int kernels and weights, or Python ints if they could be too big for an int64, and floats
+    otherwise.
+    :param positions: crab positions
+    :param kernel: convex cost of a crab moving a distance, called with an array of distances
+    :param weights: weight of each crab, 1 by default
+    :return: (target, cost)
+    """
+    import numpy as np
+
+    positions = np.asarray(positions, dtype=np.int64)
+    if not len(positions):
+        raise ValueError('no crab positions')
+
+    low, high = int(positions.min()), int(positions.max())
+
+    # a convex cost is highest at one end of the range of distances
+    furthest = np.array([0, high - low], dtype=np.int64)
+    if __integer_costs(np.asarray(kernel(furthest)), weights):
+        largest = max(abs(c) for c in kernel(furthest.astype(object)))
+        positions = positions.astype(__cost_dtype(largest, positions, weights))
+        if weights is not None:
+            weights = np.asarray(weights).astype(positions.dtype)
 
-    # Find the first and last numbers to get the full range of possible 'locations'
-    positions.sort()
-    start = positions[0]
-    end = positions[-1]
+    def cost(target):
+        fuel = kernel(np.abs(positions - target))
+        return __to_python(fuel.sum() if weights is None else np.dot(weights, fuel))
 
-    min_cost = sys.maxsize
+    while high - low > 2:
+        third = (high - low) // 3
+        left, right = low + third, high - third
+        left_cost, right_cost = cost(left), cost(right)
 
-    for target_pos in range(start, end):
-        cost = 0
-        for pos in positions:
-            no_of_steps = abs(target_pos - pos)
-            # sum all consecutive numbers for steps e.g 1 step = 1 fuel, 2 steps = 2 fuel ...
-            cost += no_of_steps * (1 + no_of_steps) / 2
-        min_cost = min(min_cost, cost)
+        if left_cost < right_cost:
+            high = right - 1
+        elif left_cost > right_cost:
+            low = left + 1
+        else:
+            low, high = left, right
 
-    return min_cost
+    return min(((target, cost(target)) for target in range(low, high + 1)), key=lambda c: c[1])
 
 
-class TestDay07(unittest.TestCase):
-    sample_test_data = '16, 1, 2, 0, 4, 2, 7, 1, 2, 14'
-    input_data = '1101,1,29,67,1102,0,1,65,1008,65,35,66,1005,66,28,1,67,65,20,4,0,1001,65,1,65,1106,0,8,99,35,67,101,99,105,32,110,39,101,115,116,32,112,97,115,32,117,110,101,32,105,110,116,99,111,100,101,32,112,114,111,103,114,97,109,10,591,116,168,1277,832,147,32,237,1060,589,149,100,137,603,662,290,361,139,1145,163,241,524,700,85,94,91,267,615,934,378,134,63,503,1022,87,44,711,26,567,49,141,80,53,1434,153,904,243,119,1064,9,202,18,1410,362,61,220,37,699,557,109,396,1065,1,928,614,351,169,498,282,156,614,879,199,259,1323,283,1128,307,374,60,218,1658,103,369,967,816,1037,694,160,1335,943,222,151,451,289,289,1079,604,165,111,130,228,45,368,153,122,356,923,691,183,386,1296,1868,367,1071,10,11,554,134,354,350,221,598,220,1082,361,35,982,18,4,11,13,262,281,57,325,204,1054,583,1166,474,141,9,788,157,85,345,903,2,365,863,661,140,131,1285,381,348,1443,926,172,374,1284,1285,915,380,433,854,11,352,152,1049,209,982,108,893,46,650,100,1653,834,1716,693,24,138,555,112,184,8,448,239,1226,45,788,109,178,517,173,152,364,190,344,951,97,644,716,746,882,58,74,149,716,1316,312,53,323,606,648,906,62,4,275,563,1092,192,527,6,58,376,350,594,50,179,483,693,321,1428,946,41,581,1794,1801,270,1344,902,1347,1064,19,168,687,1631,394,27,1327,98,212,285,436,602,936,760,175,984,1062,842,1133,572,153,792,677,1223,1949,296,221,1421,159,441,316,808,797,278,613,216,147,353,379,23,566,1149,76,232,431,1818,43,81,538,129,80,40,27,1178,348,60,512,343,378,321,1162,932,14,1293,72,846,351,632,1561,247,161,519,97,1361,350,683,118,142,16,34,1577,436,327,118,1102,195,154,579,1147,164,272,773,1017,556,549,589,32,52,118,417,394,133,29,512,1582,126,1106,156,175,484,875,467,544,300,462,22,437,255,507,355,405,1096,36,375,261,284,282,13,457,434,509,12,684,80,614,2,222,657,554,520,710,825,242,29,144,570,1116,182,861,209,159,247,191,423,733,386,385,774,810,22,131,76,105,235,1522,91,2,422,1133,81,11,151,341,317,1332,873,1218,374,0,49,19,73,268,332,60,558,244,595,210,535,7,409,985,970,223,286,84,486,246,675,1112,494,219,605,298,642,139,81,152,899,1181,157,1055,290,199,28,604,9,52,125,723,218,211,519,591,121,264,157,225,1431,172,26,424,212,1173,377,228,597,63,380,0,596,489,38,28,876,108,1669,169,295,318,251,847,1023,181,668,721,205,1376,1890,85,488,636,1022,21,1482,703,599,1136,427,513,186,1320,491,1502,528,4,247,393,152,363,243,1292,508,619,818,151,30,298,89,466,25,393,641,841,200,815,947,260,332,422,958,1186,382,814,1045,830,230,221,673,499,1402,867,635,57,814,1149,1027,830,331,1346,299,0,92,543,160,339,809,59,1128,259,271,1593,475,71,574,95,220,158,288,443,1052,156,450,1218,177,1351,204,1229,765,596,565,62,313,7,313,53,575,10,448,5,705,360,1371,1372,315,256,1323,136,62,807,238,343,173,904,67,680,162,509,231,524,196,218,681,715,552,658,183,1670,379,203,37,8,409,1403,371,69,361,511,272,498,46,489,1346,857,69,233,117,318,1199,977,871,308,435,42,797,550,406,91,171,133,1148,104,324,1489,942,530,468,196,293,534,613,73,29,497,814,1199,466,312,138,70,33,178,29,1549,98,442,23,1142,1074,551,12,741,1277,1278,217,1839,294,200,212,1014,383,1067,30,1257,279,93,786,96,219,639,932,983,45,633,687,67,726,11,162,297,1157,44,273,450,1689,1070,1407,198,1288,790,118,1221,310,655,285,167,115,870,156,217,444,518,1422,52,48,721,34,381,41,299,386,506,327,1201,262,5,42,448,246,145,1268,1047,944,428,29,1,265,381,767,481,409,1747,110,1238,1821,35,594,1,784,301,1228,72,1247,161,582,380,48,51,904,751,179,409,1219,238,453,42,248,99,94,10,387,257,70,1339,130,943,569,986,46,100,77,270,906,506,851,1,1550,983,192,351,233,798,1408,1029,215,95,240,1615,522,1285,392,133,794,431,195,959,504,679,50,837,58,964,342,1548,218,388,596,448,1377,617,442,210,412,355,1249,1094,1060,1718,131,248,4,301,809,980,166,80,282,1846,482,89,221,22,80,356,279,330,13,471,457,28,254,174,110,1742,26,633,1708,818,441,1578,1013,1312,897,458,11,696,1084,453,507,315,149,413,7,36,1000,458,181,286,300,132,1453,76,293,415,288,141,52,1190,1250,107,63,708,356,599,870,769,264,274'
+def __integer_costs(costs, weights):
+    """Whether the kernel's costs (for some int64 distances) and the weights are all integers, so can be exact"""
+    import numpy as np
 
-    def test_part1_sample_data(self):
-        result = part1(self.sample_test_data)
-        self.assertEqual(37, result)
+    return costs.dtype.kind in 'iub' and (weights is None or np.asarray(weights).dtype.kind in 'iub')
 
-    def test_part1(self):
-        result = part1(self.input_data)
-        self.assertEqual(340987, result)
 
-    def test_part2_sample_data(self):
-        result = part2(self.sample_test_data)
-        self.assertEqual(168, result)
+def __cost_dtype(largest_cost, positions, weights):
+    """int64 if the total cost can't overflow one, otherwise object, for Python ints"""
+    import numpy as np
 
-    def test_part2(self):
-        result = part2(self.input_data)
-        self.assertEqual(96987874, result)
+    crabs = len(positions) if weights is None else sum(abs(int(w)) for w in weights)
+    return np.int64 if largest_cost * crabs <= np.iinfo(np.int64).max else object
 
 
-if __name__ == '__main__':
-    unittest.main()
+def __to_python(value):
+    # NumPy scalars to Python numbers, Python ints (from object arrays) as they are
+    return value.item() if hasattr(value, 'item') else value
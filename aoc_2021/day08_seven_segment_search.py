@@ -6,184 +6,167 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.parse_cache import cached_parser
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day08_input.txt'
 test_input_file = r'resources/day08_test_input.txt'
 
 
+# the segments lit for each digit, with the displays wired correctly
+__digit_segments = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+__popcounts = [bin(mask).count('1') for mask in range(128)]
+
+
+def __to_mask(pattern):
+    mask = 0
+    for c in pattern:
+        mask |= 1 << (ord(c) - 97)
+    return mask
+
+
+def __signature(mask, one, four):
+    # the number of segments, and the number shared with a 1 and with a 4, whatever the wiring
+    return __popcounts[mask] << 6 | __popcounts[mask & one] << 3 | __popcounts[mask & four]
+
+
+def __signature_table():
+    """Digit for each signature, from the correctly wired digits"""
+    masks = [__to_mask(segments) for segments in __digit_segments]
+    table = [-1] * 512
+    for digit, mask in enumerate(masks):
+        table[__signature(mask, masks[1], masks[4])] = digit
+    return table
+
+
+__signatures = __signature_table()
+
+
+@profiled
 def part1(data):
     """
     Part one, count all the 7 segment displays showing a '1', '4', '7' or '8'
-    Each of these has a unique number of 'on' segments, so very easy to identify them
+    Each of these has a unique number of 'on' segments, so very easy to identify them, from a histogram of the
+    number of segments in the output values
     """
-    entries = __parse_data(data)
-    count = 0
-    for entry in entries:
-        for e in entry[1]:
-            if len(e) == 2 or len(e) == 4 or len(e) == 3 or len(e) == 7:
-                count += 1
-    return count
+    return __count_unique_lengths(__parse_data(data))
 
 
+@profiled
 def part2(data):
     """
     A little more tricky. Given only a list of segments that are 'on', but scrambled,
     correctly map the scrambled digits to the correct number to sum up the output
-    As above, some digits are easy to identify, but several have the same number of segments, so let the detective
-    work begin.
+    The patterns are 7 bit masks, and a digit is known from its number of segments and how many it shares with the
+    1 and the 4, which are easy to find
+    """
+    return __decode_entries(__parse_data(data))
 
-    Not particularly pretty or elegant,
-    but the method below will at least sort the mixed up input to identify the correct digits
+
+@profiled
+def solve(data):
+    """
+    Both parts from one parse of the entries
     """
+    masks = __parse_data(data)
+    return __count_unique_lengths(masks), __decode_entries(masks)
+
+
+def __count_unique_lengths(masks):
+    lengths = [0] * 8
+    for output in range(11, 15):
+        for mask in masks[output::15]:
+            lengths[__popcounts[mask]] += 1
+    return lengths[2] + lengths[3] + lengths[4] + lengths[7]
+
+
+def __decode_entries(masks):
+    """Sum of the output values of all the entries"""
+    popcount = __popcounts.__getitem__
     total = 0
-    entries = __parse_data(data)
 
-    for entry in entries:
-        # two maps, as want to map from digit -> segments and segments -> digits for easy reference later
-        digits = {}
-        segments = {}
+    for start in range(0, len(masks), 15):
+        patterns = masks[start:start + 10]
+        sizes = list(map(popcount, patterns))
+        digits = __decoder(patterns[sizes.index(2)], patterns[sizes.index(4)])
 
-        # several passes for each set of signal patterns to identify them all correctly,
-        # with effort maybe able to reduce this
-        __decode_numbers_with_unique_no_of_segments(entry[0], digits, segments)
+        a, b, c, d = masks[start + 11:start + 15]
+        total += digits[a] * 1000 + digits[b] * 100 + digits[c] * 10 + digits[d]
 
-        __decode_three_and_nine(entry[0], digits, segments)
+    return total
 
-        __decode_zero_and_six(entry[0], digits, segments)
 
-        __decode_two_and_five(entry[0], digits, segments)
+@profiled
+def part2_numpy(data):
+    """
+    As part2, decoding all the entries at once with NumPy
+    """
+    return __decode_entries_numpy(__parse_data(data))
 
-        # wow! convoluted, but managed to map each digit, now simply decode and make a four-digit number
 
-        temp = ''
-        temp += str(segments["".join(sorted(entry[1][0]))])
-        temp += str(segments["".join(sorted(entry[1][1]))])
-        temp += str(segments["".join(sorted(entry[1][2]))])
-        temp += str(segments["".join(sorted(entry[1][3]))])
+@profiled
+def solve_numpy(data):
+    """
+    As solve, decoding all the entries at once with NumPy
+    """
+    masks = __parse_data(data)
+    return __count_unique_lengths(masks), __decode_entries_numpy(masks)
 
-        number = int(temp)
-        total += number
-    return total
 
+def __decode_entries_numpy(masks):
+    """As __decode_entries, finding every entry's 1 and 4 and the signatures of its outputs as array operations"""
+    import numpy as np
 
-def __parse_data(data):
-    entries = []
+    entries = np.array(masks, dtype=np.int64).reshape(-1, 15)
+    patterns = entries[:, :10]
+    outputs = entries[:, 11:]
+    popcounts = np.array(__popcounts)
 
-    for entry in data:
-        parts = entry.split('|')
-        signal_patterns = parts[0].rstrip().split(' ')
-        output_vales = parts[1].lstrip().split(' ')
+    sizes = popcounts[patterns]
+    if not ((sizes == 2).sum(axis=1) == 1).all() or not ((sizes == 4).sum(axis=1) == 1).all():
+        raise ValueError('every entry must have one pattern of 2 segments and one of 4')
+    one = patterns[sizes == 2][:, None]
+    four = patterns[sizes == 4][:, None]
 
-        data_in = []
-        for i in signal_patterns:
-            data_in.append(i)
+    signatures = popcounts[outputs] << 6 | popcounts[outputs & one] << 3 | popcounts[outputs & four]
+    digits = np.array(__signatures)[signatures]
+    return int((digits @ np.array([1000, 100, 10, 1])).sum())
 
-        entries.append([data_in, output_vales])
 
-    return entries
+# digit for every mask, for each wiring of the 1 and 4 seen so far
+__decoders = {}
+
 
+def __decoder(one, four):
+    key = one << 7 | four
+    digits = __decoders.get(key)
+    if digits is None:
+        digits = __decoders[key] = [__signatures[__signature(mask, one, four)] for mask in range(128)]
+    return digits
 
-def __decode_numbers_with_unique_no_of_segments(entry, digits, segments):
-    # map all the digits that we can identify based on unique number of segments
-    for e in entry:
-        if len(e) == 2:
-            digits[1] = "".join(sorted(e))
-            segments["".join(sorted(e))] = 1
-        if len(e) == 3:
-            digits[7] = "".join(sorted(e))
-            segments["".join(sorted(e))] = 7
-        if len(e) == 4:
-            digits[4] = "".join(sorted(e))
-            segments["".join(sorted(e))] = 4
-        if len(e) == 7:
-            digits[8] = "".join(sorted(e))
-            segments["".join(sorted(e))] = 8
-
-
-def __decode_three_and_nine(entry, digits, segments):
-    for e in entry:
-        # 2, 3 & 5 all contains 5 segments
-        # however a 3 can be identified as it must contain both segments of a '1' (identified earlier)
-        if len(e) == 5:
-            # 3 must contain both 1's segments
-            if digits[1][0] in e and digits[1][1] in e:
-                digits[3] = "".join(sorted(e))
-                segments["".join(sorted(e))] = 3
-        # 0, 6 & 9 all contains 6 segments
-        # however a 9 can be identified as it must contain both segments of a '4' (identified earlier)
-        elif len(e) == 6:
-            # 9 must contain all 4's segments
-            if digits[4][0] in e and digits[4][1] in e and digits[4][2] in e and digits[4][3] in e:
-                digits[9] = "".join(sorted(e))
-                segments["".join(sorted(e))] = 9
-
-
-def __decode_zero_and_six(entry, digits, segments):
-    for e in entry:
-        if len(e) == 6:
-            # 0, 6 & 9 all contains 6 segments
-            # 6 or 0 won't contain all elements of a '4', so can eliminate '9'
-            if digits[4][0] not in e or digits[4][1] not in e or digits[4][2] not in e or digits[4][3] not in e:
-                # a 9 must contain all segments of a '1'
-                if digits[1][0] in e and digits[1][1] in e:
-                    digits[0] = "".join(sorted(e))
-                    segments["".join(sorted(e))] = 0
-                # By process of elimination, must be a 6
-                else:
-                    digits[6] = "".join(sorted(e))
-                    segments["".join(sorted(e))] = 6
-
-
-def __decode_two_and_five(entry, digits, segments):
-    for e in entry:
-        # 2,3,5 all have 5 segments
-        if len(e) == 5:
-            # using a 6, it's possible to find the character mapped to segment 'c'
-            six = digits[6]
-            c_seg = ''
-            # find the missing 'c' segment from the 6
-            for c in 'abcdefg':
-                if c not in six:
-                    c_seg = c
-                    break
-
-            # ignore 3 and focus on 2 and 5
-            if digits[1][0] not in e or digits[1][1] not in e:
-                # 2 contains the 'c' segment
-                if c_seg in e:
-                    digits[2] = "".join(sorted(e))
-                    segments["".join(sorted(e))] = 2
-                # 5 does not contains the 'c' segment
-                else:
-                    digits[5] = "".join(sorted(e))
-                    segments["".join(sorted(e))] = 5
-
-
-class TestDay08(unittest.TestCase):
-
-    def test_part1_sample_data(self):
-        data = read_input(test_input_file)
-        result = part1(data)
-        self.assertEqual(26, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(543, result)
-
-    def test_part2_sample_data(self):
-        data = read_input(test_input_file)
-        result = part2(data)
-        self.assertEqual(61229, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(994266, result)
-
-
-if __name__ == '__main__':
-    unittest.main()
+
+# mask for each pattern seen so far, -1 for the separator
+__pattern_masks = {'|': -1}
+
+
+@phase('parse')
+@cached_parser(version=2)
+def __parse_data(data):
+    """
+    The patterns of all the entries as one flat list of masks, the segments a to g being bits 0 to 6. Each entry is 15
+    masks: 10 signal patterns, -1 for the separator and 4 output values
+    """
+    values = ' '.join(data).split()
+
+    entries = list(map(__pattern_masks.get, values))
+    if None in entries:
+        for value in set(values):
+            if value not in __pattern_masks:
+                __pattern_masks[value] = __to_mask(value)
+        entries = list(map(__pattern_masks.get, values))
+
+    if len(entries) % 15 or entries[10::15].count(-1) != len(entries) // 15:
+        raise ValueError('each entry must be 10 signal patterns | 4 output values')
+    return entries
@@ -6,17 +6,23 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.metrics import counter
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day09_input.txt'
 test_input_file = r'resources/day09_test_input.txt'
 
+neighbour_lookups = counter('aoc_2021_day09_neighbour_lookups_total', 'Neighbour lookups for a point on the map')
 
+
+@profiled
 def part1(data):
     lowest_nums = __find_lowest_points(data)
+    return __risk_level(lowest_nums)
+
 
+def __risk_level(lowest_nums):
     total = 0
     for num in lowest_nums:
         total += num[0]
@@ -24,6 +30,7 @@ def part1(data):
     return total + len(lowest_nums)
 
 
+@phase('solve')
 def __find_lowest_points(data):
     height = len(data)
     width = len(data[0])
@@ -46,6 +53,7 @@ def __find_lowest_points(data):
 
 
 def __get_neighbours(row, col, height, width):
+    neighbour_lookups.inc()
     n1 = (row - 1, col)
     n2 = (row + 1, col)
     n3 = (row, col + 1)
@@ -66,6 +74,7 @@ def __get_neighbours(row, col, height, width):
 
 
 def __get_unique_neighbours(data, row, col, seen, height, width):
+    neighbour_lookups.inc()
     n1 = (row - 1, col)
     n2 = (row + 1, col)
     n3 = (row, col + 1)
@@ -90,11 +99,24 @@ def __get_unique_neighbours(data, row, col, seen, height, width):
     return results
 
 
+@profiled
 def part2(data):
-    height = len(data)
-    width = len(data[0])
+    lowest_nums = __find_lowest_points(data)
+    return __largest_basins(data, lowest_nums)
 
+
+@profiled
+def solve(data):
+    """
+    Both parts from one search for the lowest points, which part 2 uses as the bottom of each basin
+    """
     lowest_nums = __find_lowest_points(data)
+    return __risk_level(lowest_nums), __largest_basins(data, lowest_nums)
+
+
+def __largest_basins(data, lowest_nums):
+    height = len(data)
+    width = len(data[0])
 
     # find all the basins
     basin_totals = []
@@ -128,29 +150,3 @@ def __calc_basin(data, num, r, c, seen, basin, height, width):
         __calc_basin(data, candidate, row, col, seen, basin, height, width)
 
     return basin
-
-
-class TestDay09(unittest.TestCase):
-    def test_part1_sample_data(self):
-        data = read_input(test_input_file)
-        result = part1(data)
-        self.assertEqual(15, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(504, result)
-
-    def test_part2_sample_data(self):
-        data = read_input(test_input_file)
-        result = part2(data)
-        self.assertEqual(1134, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(1558722, result)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -6,8 +6,7 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.profiling import profiled
 
 
 input_file = r'resources/day10_input.txt'
@@ -19,62 +18,71 @@ scoring_part1 = {')': 3, ']': 57, '}': 1197, '>': 25137}
 scoring_part2 = {')': 1, ']': 2, '}': 3, '>': 4}
 
 
+@profiled
 def part1(data):
     score = 0
     for line in data:
-        res = __is_corrupt(line)
-        if res[0]:
-            score += scoring_part1[res[1]]
+        corrupt_char, _ = __scan_line(line)
+        if corrupt_char:
+            score += scoring_part1[corrupt_char]
     return score
 
 
+@profiled
 def part2(data):
-    total_score = 0
     all_scores = []
 
     for line in data:
-        res = __is_corrupt(line)
-        if not res[0]:
-            to_complete = __complete_line(line)
-            score = 0
-            for c in to_complete:
-                score = score * 5
-                score += scoring_part2[c]
-            all_scores.append(score)
-            total_score += score
+        corrupt_char, stack = __scan_line(line)
+        if not corrupt_char:
+            all_scores.append(__completion_score(stack))
 
     all_scores.sort()
     return all_scores[int(len(all_scores) / 2)]
 
 
-def __is_corrupt(line):
-    stack = []
+@profiled
+def solve(data):
+    """
+    Both parts with a single scan of each line. The scan either finds the corrupt character for part 1,
+    or leaves the stack of unclosed characters to complete for part 2
+    """
+    score = 0
+    all_scores = []
 
-    for c in line:
-        if c in brackets.keys():
-            stack.append(c)
+    for line in data:
+        corrupt_char, stack = __scan_line(line)
+        if corrupt_char:
+            score += scoring_part1[corrupt_char]
         else:
-            if not __is_closing_character(stack.pop(), c):
-                return True, c
-    return False, ''
+            all_scores.append(__completion_score(stack))
+
+    all_scores.sort()
+    return score, all_scores[int(len(all_scores) / 2)]
 
 
-def __complete_line(line):
+def __scan_line(line):
+    """
+    :return: (the first corrupt character, or '' if there isn't one, the stack of unclosed characters)
+    """
     stack = []
 
     for c in line:
-        if c in brackets.keys():
+        if c in brackets:
             stack.append(c)
         else:
             if not __is_closing_character(stack.pop(), c):
-                return []
+                return c, stack
+    return '', stack
 
-    required = []
-    stack.reverse()
-    for c in stack:
-        required.append(__get_closing_character(c))
 
-    return required
+def __completion_score(stack):
+    # closing the unclosed characters, the most recently opened first
+    score = 0
+    for c in reversed(stack):
+        score = score * 5
+        score += scoring_part2[__get_closing_character(c)]
+    return score
 
 
 def __is_closing_character(opening_char, closing_char):
@@ -83,29 +91,3 @@ def __is_closing_character(opening_char, closing_char):
 
 def __get_closing_character(opening_char):
     return brackets[opening_char]
-
-
-class TestDay10(unittest.TestCase):
-    def test_part1_sample_data(self):
-        data = read_input(input_test_file)
-        result = part1(data)
-        self.assertEqual(26397, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(216297, result)
-
-    def test_part2_sample_data(self):
-        data = read_input(input_test_file)
-        result = part2(data)
-        self.assertEqual(288957, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(2165057169, result)
-
-
-if __name__ == '__main__':
-    unittest.main()
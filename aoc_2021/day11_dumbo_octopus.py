@@ -6,14 +6,17 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.metrics import counter
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day11_input.txt'
 test_input_file = r'resources/day11_test_input.txt'
 
+neighbour_lookups = counter('aoc_2021_day11_neighbour_lookups_total', 'Neighbour lookups for a flashing octopus')
 
+
+@profiled
 def part1(data):
     grid = __create_grid(data)
 
@@ -24,71 +27,41 @@ def part1(data):
     return flashes
 
 
+@phase('solve')
 def __step(grid):
+    """
+    Advance the grid one step, flashing until no octopus is left above 9, and return the number of flashes
+    """
     width = len(grid[0])
     height = len(grid)
 
     flashed = set()
 
     # rule 1: increment all numbers by 1
-    for r, row in enumerate(list(grid)):
+    for r, row in enumerate(grid):
         for c, col in enumerate(row):
             grid[r][c] += 1
 
     # rule 2: any over 9 flash, and cause neighbours to flash too
-    flashes = 0
-    for _ in range(10):
-        for r, row in enumerate(list(grid)):
-            for c, col in enumerate(row):
-                if grid[r][c] > 9:
-                    if (r, c) not in flashed:
-                        flashes += 1
-                        flashed.add((r, c))
-                        grid[r][c] = 0
-
-                    neighbours = __get_neighbours(r, c, width, height)
-
-                    for coordinates in neighbours:
-                        if (coordinates[0], coordinates[1]) not in flashed:
-                            grid[coordinates[0]][coordinates[1]] += 1
-
-    return flashes
-
+    pending = [(r, c) for r, row in enumerate(grid) for c, col in enumerate(row) if col > 9]
+    while pending:
+        r, c = pending.pop()
+        if (r, c) in flashed:
+            continue
 
-def __step_until__in_sync(grid):
-    width = len(grid[0])
-    height = len(grid)
-
-    flashed = set()
-
-    # rule 1: increment all numbers by 1
-    for r, row in enumerate(list(grid)):
-        for c, col in enumerate(row):
-            grid[r][c] += 1
+        flashed.add((r, c))
+        grid[r][c] = 0
 
-    # rule 2: any over 9 flash, and cause neighbours to flash too
-    flashes = 0
-    for _ in range(200):
-        for r, row in enumerate(list(grid)):
-            for c, col in enumerate(row):
-                if grid[r][c] > 9:
-                    if (r, c) not in flashed:
-                        flashes += 1
-                        flashed.add((r, c))
-                        grid[r][c] = 0
-
-                    neighbours = __get_neighbours(r, c, width, height)
-                    # print(neighbours)
-                    for coordinates in neighbours:
-                        if (coordinates[0], coordinates[1]) not in flashed:
-                            grid[coordinates[0]][coordinates[1]] += 1
-
-        if __is_all_zeros_grid(grid):
-            return width * height
+        for nr, nc in __get_neighbours(r, c, width, height):
+            if (nr, nc) not in flashed:
+                grid[nr][nc] += 1
+                if grid[nr][nc] > 9:
+                    pending.append((nr, nc))
 
-    return flashes
+    return len(flashed)
 
 
+@phase('parse')
 def __create_grid(data):
     grid = []
 
@@ -100,15 +73,8 @@ def __create_grid(data):
     return grid
 
 
-def __is_all_zeros_grid(grid):
-    for row in grid:
-        for c in row:
-            if c != 0:
-                return False
-    return True
-
-
 def __get_neighbours(row, col, width, height):
+    neighbour_lookups.inc()
     # up and down
     n1 = (row - 1, col)
     n2 = (row + 1, col)
@@ -135,39 +101,38 @@ def __get_neighbours(row, col, width, height):
     return results
 
 
+@profiled
 def part2(data):
     total_squares = len(data) * len(data[0])
 
     grid = __create_grid(data)
     for step_no in range(2000):
-        flashes = __step_until__in_sync(grid)
+        flashes = __step(grid)
         if flashes == total_squares:
             break
 
     return step_no + 1
 
 
-class TestDay11(unittest.TestCase):
-    def test_part1_sample_data(self):
-        data = read_input(test_input_file)
-        result = part1(data)
-        self.assertEqual(1656, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(1642, result)
-
-    def test_part2_sample_data(self):
-        data = read_input(test_input_file)
-        result = part2(data)
-        self.assertEqual(195, result)
+@profiled
+def solve(data):
+    """
+    Both parts from one simulation, counting the flashes over the first 100 steps while stepping until all the
+    octopuses flash together
+    """
+    total_squares = len(data) * len(data[0])
 
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(320, result)
+    grid = __create_grid(data)
+    total_flashes = 0
+    in_sync_step = None
 
+    for step_no in range(2000):
+        flashes = __step(grid)
+        if step_no < 100:
+            total_flashes += flashes
+        if in_sync_step is None and flashes == total_squares:
+            in_sync_step = step_no + 1
+        if in_sync_step is not None and step_no >= 99:
+            break
 
-if __name__ == '__main__':
-    unittest.main()
+    return total_flashes, in_sync_step if in_sync_step is not None else step_no + 1
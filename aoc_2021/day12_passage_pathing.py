@@ -6,35 +6,45 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
 from collections import defaultdict
-from shared.file_reader import read_input
+from shared.metrics import counter
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day12_input.txt'
 test_input_file = r'resources/day12_test_input.txt'
 
+stack_pushes = counter('aoc_2021_day12_stack_pushes_total', 'Partial paths pushed onto the search stack')
 
+
+@profiled
 def part1(data):
     """
     A graph problem, so need a variation of Depth First Search. We want all unique paths, not just one path
     """
-    graph = defaultdict(list)
-
-    for line in data:
-        e = line.split('-')
-        if e[1] != 'start':
-            graph[e[0]].append(e[1])
-        if e[0] != 'start':
-            graph[e[1]].append(e[0])
-
-    return find_unique_paths(graph, 'start', 'end')
+    return find_unique_paths(__build_graph(data), 'start', 'end')
 
 
+@profiled
 def part2(data):
     """
     A graph problem, so need a variation of Depth First Search. We want all unique paths, not just one path
     """
+    return find_unique_paths_part2(__build_graph(data), 'start', 'end')
+
+
+@profiled
+def solve(data):
+    """
+    Both parts, searching the one graph
+    """
+    graph = __build_graph(data)
+    return find_unique_paths(graph, 'start', 'end'), find_unique_paths_part2(graph, 'start', 'end')
+
+
+@phase('parse')
+def __build_graph(data):
+    # no way back to the start, so it is never an option to search
     graph = defaultdict(list)
 
     for line in data:
@@ -44,9 +54,10 @@ def part2(data):
         if n1 != 'start':
             graph[n2].append(n1)
 
-    return find_unique_paths_part2(graph, 'start', 'end')
+    return graph
 
 
+@phase('solve')
 def find_unique_paths(graph, start, end):
     stack = [(start, {start})]
     total = 0
@@ -62,9 +73,11 @@ def find_unique_paths(graph, start, end):
                 # can visit the small caves once only (lowercase letters)
                 if loc not in visited or loc.isupper():
                     stack.append((loc, visited | {loc}))
+                    stack_pushes.inc()
     return total
 
 
+@phase('solve')
 def find_unique_paths_part2(graph, start, end):
     stack = [(start, {start}, False)]
     total = 0
@@ -79,34 +92,9 @@ def find_unique_paths_part2(graph, start, end):
             for loc in graph[node]:
                 if loc not in visited or loc.isupper():
                     stack.append((loc, visited | {loc}, visited_twice))
+                    stack_pushes.inc()
                 else:
                     if not visited_twice:
                         stack.append((loc, visited, True))
+                        stack_pushes.inc()
     return total
-
-
-class TestDay12(unittest.TestCase):
-
-    def test_part1_sample_data(self):
-        data = read_input(test_input_file)
-        result = part1(data)
-        self.assertEqual(10, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(5920, result)
-
-    def test_part2_sample_data(self):
-        data = read_input(test_input_file)
-        result = part2(data)
-        self.assertEqual(36, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        self.assertEqual(155477, result)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -6,14 +6,15 @@ Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
 
-import unittest
-from shared.file_reader import read_input
+from shared.parse_cache import cached_parser
+from shared.profiling import phase, profiled
 
 
 input_file = r'resources/day13_input.txt'
 test_input_file = r'resources/day13_test_input.txt'
 
 
+@profiled
 def part1(data):
     coordinates, instructions, size = __parse_data(data)
 
@@ -29,6 +30,7 @@ def part1(data):
     return __count_hashes(grid)
 
 
+@profiled
 def part2(data):
     coordinates, instructions, size = __parse_data(data)
     new_coordinates = list(coordinates)
@@ -46,6 +48,34 @@ def part2(data):
     return None
 
 
+@profiled
+def solve(data):
+    """
+    Both parts from one parse and one run of the folds. The dots after the first fold are a set,
+    so part 1 is just its size, and the grid only needs plotting at the folded size for part 2
+    """
+    coordinates, instructions, size = __parse_data(data)
+    new_coordinates = list(coordinates)
+    dots_after_first_fold = None
+
+    for axis, fold_index in instructions:
+        if axis == 'y':
+            new_coordinates = fold_up(new_coordinates, fold_index)
+        if axis == 'x':
+            new_coordinates = fold_left(new_coordinates, fold_index)
+
+        if dots_after_first_fold is None:
+            dots_after_first_fold = len(new_coordinates)
+
+    folded_size = (max(y for _, y in new_coordinates) + 1, max(x for x, _ in new_coordinates) + 1)
+    grid = __plot_grid(new_coordinates, folded_size)
+
+    # Read the characters from the printed grid
+    __print_grid(grid, (6, 40))
+    return dots_after_first_fold, None
+
+
+@phase('solve')
 def fold_left(coordinates, x_fold):
     # fold left to right (vertical fold)
     new_coordinates = set()
@@ -60,6 +90,7 @@ def fold_left(coordinates, x_fold):
     return new_coordinates
 
 
+@phase('solve')
 def fold_up(coordinates, y_fold):
     new_coordinates = set()
     # fold up (horizontal)
@@ -74,6 +105,7 @@ def fold_up(coordinates, y_fold):
     return new_coordinates
 
 
+@phase('render')
 def __plot_grid(coordinates, size):
     height, width = size
     grid = []
@@ -91,6 +123,7 @@ def __plot_grid(coordinates, size):
     return grid
 
 
+@phase('render')
 def __count_hashes(grid):
     count = 0
     for row in grid:
@@ -100,6 +133,7 @@ def __count_hashes(grid):
     return count
 
 
+@phase('render')
 def __print_grid(grid, size):
     for row in grid[:size[0]]:
         for col in row[:size[1]]:
@@ -108,6 +142,8 @@ def __print_grid(grid, size):
     print("\n\n")
 
 
+@phase('parse')
+@cached_parser(version=1)
 def __parse_data(data):
     height = 0
     width = 0
@@ -130,24 +166,3 @@ def __parse_data(data):
     width += 1
     height += 1
     return coordinates, instructions, (height, width)
-
-
-class TestDay13(unittest.TestCase):
-    def test_part1_sample_data(self):
-        data = read_input(test_input_file)
-        result = part1(data)
-        self.assertEqual(17, result)
-
-    def test_part1(self):
-        data = read_input(input_file)
-        result = part1(data)
-        self.assertEqual(770, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-        result = part2(data)
-        # self.assertEqual('EPUELPBR', result)
-
-
-if __name__ == '__main__':
-    unittest.main()
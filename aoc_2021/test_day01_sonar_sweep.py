@@ -0,0 +1,97 @@
+import random
+import unittest
+from shared.file_reader import read_input, stream_input
+from shared.int_parser import read_int_ndarray, read_ints
+from aoc_2021.day01_sonar_sweep import part1, part2, solve, input_file, count_window_increases, \
+    count_window_increases_multi, part1_numpy, part2_numpy, solve_numpy, count_window_increases_numpy
+
+
+class TestDay01(unittest.TestCase):
+    sample_test_data = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+    def test_part1_sample_data(self):
+        result = part1(self.sample_test_data)
+        self.assertEqual(7, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+
+        result = part1(data)
+        self.assertEqual(1184, result)
+
+    def test_part2_sample_data(self):
+        result = part2(self.sample_test_data)
+        self.assertEqual(5, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+
+        result = part2(data)
+        self.assertEqual(1158, result)
+
+    def test_part1_streamed(self):
+        result = part1(stream_input(input_file))
+        self.assertEqual(1184, result)
+
+    def test_part2_streamed(self):
+        result = part2(stream_input(input_file))
+        self.assertEqual(1158, result)
+
+    def test_part1_parsed_ints(self):
+        result = part1(read_ints(input_file))
+        self.assertEqual(1184, result)
+
+    def test_part2_parsed_ints(self):
+        result = part2(read_ints(input_file))
+        self.assertEqual(1158, result)
+
+    def test_solve_sample_data(self):
+        result = solve(self.sample_test_data)
+        self.assertEqual((7, 5), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((1184, 1158), result)
+
+    def test_window_increases_sample_data(self):
+        self.assertEqual(7, count_window_increases(self.sample_test_data, 1))
+        self.assertEqual(5, count_window_increases(self.sample_test_data, 3))
+        self.assertEqual(0, count_window_increases(self.sample_test_data, 10))
+
+    def test_window_increases_multi(self):
+        result = count_window_increases_multi(stream_input(input_file), [1, 3, 5])
+        self.assertEqual([1184, 1158, count_window_increases(read_input(input_file), 5)], result)
+
+    def test_window_increases_against_window_sums(self):
+        rng = random.Random(1)
+        data = [rng.randint(0, 50) for _ in range(500)]
+        for window_size in (1, 2, 3, 7, 50):
+            sums = [sum(data[i:i + window_size]) for i in range(len(data) - window_size + 1)]
+            expected = sum(1 for a, b in zip(sums, sums[1:]) if b > a)
+            self.assertEqual(expected, count_window_increases(iter(data), window_size))
+
+    def test_window_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            count_window_increases(self.sample_test_data, 0)
+
+    def test_part1_numpy(self):
+        result = part1_numpy(read_int_ndarray(input_file))
+        self.assertEqual(1184, result)
+
+    def test_part2_numpy(self):
+        result = part2_numpy(read_int_ndarray(input_file))
+        self.assertEqual(1158, result)
+
+    def test_solve_numpy(self):
+        self.assertEqual((7, 5), solve_numpy(self.sample_test_data))
+        self.assertEqual((1184, 1158), solve_numpy(read_input(input_file)))
+
+    def test_window_increases_numpy_matches_python(self):
+        rng = random.Random(2)
+        data = [rng.randint(0, 50) for _ in range(1000)]
+        for window_size in (1, 2, 3, 7, 999, 1000, 1001):
+            self.assertEqual(count_window_increases(data, window_size), count_window_increases_numpy(data, window_size))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from shared.file_reader import read_input, stream_input
+from aoc_2021.day02_dive import part1, part2, solve, solve_file_parallel, combine, reduce_range, \
+    part1_numpy, part2_numpy, solve_numpy, input_file
+
+
+class TestDay02(unittest.TestCase):
+    sample_test_data = ['forward 5', 'down 5', 'forward 8', 'up 3', 'down 8', 'forward 2']
+
+    def test_part1_sample_data(self):
+        result = part1(self.sample_test_data)
+        self.assertEqual(150, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(2073315, result)
+
+    def test_part2_sample_data(self):
+        result = part2(self.sample_test_data)
+        self.assertEqual(900, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+
+        result = part2(data)
+        self.assertEqual(1840311528, result)
+
+    def test_part1_streamed(self):
+        result = part1(stream_input(input_file))
+        self.assertEqual(2073315, result)
+
+    def test_part2_streamed(self):
+        result = part2(stream_input(input_file))
+        self.assertEqual(1840311528, result)
+
+    def test_solve_sample_data(self):
+        result = solve(self.sample_test_data)
+        self.assertEqual((150, 900), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((2073315, 1840311528), result)
+
+    def test_part1_numpy(self):
+        self.assertEqual(150, part1_numpy(self.sample_test_data))
+        self.assertEqual(2073315, part1_numpy(read_input(input_file)))
+
+    def test_part2_numpy(self):
+        self.assertEqual(900, part2_numpy(self.sample_test_data))
+        self.assertEqual(1840311528, part2_numpy(read_input(input_file)))
+
+    def test_solve_numpy(self):
+        self.assertEqual((150, 900), solve_numpy(self.sample_test_data))
+        self.assertEqual((2073315, 1840311528), solve_numpy(read_input(input_file)))
+        self.assertEqual((0, 0), solve_numpy([]))
+
+    def test_solve_numpy_invalid_direction(self):
+        with self.assertRaises(Exception):
+            solve_numpy(['forward 5', 'sideways 2'])
+
+    def test_solve_file_parallel(self):
+        expected = solve(read_input(input_file))
+        self.assertEqual(expected, solve_file_parallel(input_file, processes=1))
+        self.assertEqual(expected, solve_file_parallel(input_file, processes=2))
+        self.assertEqual(expected, solve_file_parallel(input_file, processes=1, chunks=97))
+
+    def test_solve_file_parallel_sample_data(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'input.txt')
+            with open(filename, 'w') as file:
+                # no trailing newline
+                file.write('\n'.join(self.sample_test_data))
+
+            for chunks in range(1, 70):
+                self.assertEqual((150, 900), solve_file_parallel(filename, processes=1, chunks=chunks))
+
+    def test_solve_file_parallel_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'input.txt')
+            open(filename, 'w').close()
+            self.assertEqual((0, 0), solve_file_parallel(filename, processes=1))
+
+    def test_combine(self):
+        size = os.path.getsize(input_file)
+        whole = reduce_range(input_file, 0, size)
+        first = reduce_range(input_file, 0, size // 3)
+        second = reduce_range(input_file, size // 3, size)
+        self.assertEqual(whole, combine(first, second))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day03_binary_diagnostic import part1, part2, solve, input_file
+
+
+class TestDay03(unittest.TestCase):
+    sample_test_data = ['00100', '11110', '10110', '10111', '10101', '01111', '00111', '11100', '10000', '11001',
+                        '00010', '01010']
+
+    def test_part1_sample_data(self):
+        result = part1(self.sample_test_data)
+        self.assertEqual(198, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(3895776, result)
+
+    def test_part2_sample_data(self):
+        result = part2(self.sample_test_data)
+        self.assertEqual(230, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(7928162, result)
+
+    def test_solve_sample_data(self):
+        result = solve(self.sample_test_data)
+        self.assertEqual((198, 230), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((3895776, 7928162), result)
+
+    def test_part2_matches_filtering(self):
+        rng = random.Random(3)
+        for width in (1, 5, 12, 64):
+            # small ranges of values, so there are plenty of duplicates
+            data = [f'{rng.getrandbits(min(width, 6)) << (width - min(width, 6)):0{width}b}' for _ in range(200)]
+            self.assertEqual(self.__filter_rating(data, False) * self.__filter_rating(data, True), part2(data))
+
+    def test_part1_any_width(self):
+        data = ['1' + '0' * 63, '1' + '0' * 63, '0' * 64]
+        self.assertEqual((1 << 63) * ((1 << 63) - 1), part1(data))
+        self.assertEqual(0b10 * 0b01, part1(['10', '11', '00']))
+        self.assertEqual(0b10 * 0b01, part1(['10', '11', '0']))
+
+    @staticmethod
+    def __filter_rating(data, least_common):
+        # the puzzle's description of the rating search
+        for i in range(len(data[0])):
+            if len(data) == 1:
+                break
+            ones = sum(1 for number in data if number[i] == '1')
+            zeros = len(data) - ones
+            if zeros == 0 or ones == 0:
+                continue
+            if least_common:
+                bit = '1' if ones < zeros else '0'
+            else:
+                bit = '1' if ones >= zeros else '0'
+            data = [number for number in data if number[i] == bit]
+        return int(data[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import random
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day04_giant_squid import part1, part2, solve, play, input_file, test_data_input_file, \
+    part1_numpy, part2_numpy, solve_numpy, play_numpy
+
+
+class TestDay04(unittest.TestCase):
+
+    def test_part1_sample_data(self):
+        data = read_input(test_data_input_file)
+        result = part1(data)
+        self.assertEqual(4512, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(31424, result)
+
+    def test_part2_sample_data(self):
+        data = read_input(test_data_input_file)
+        result = part2(data)
+        self.assertEqual(1924, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(23042, result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(test_data_input_file))
+        self.assertEqual((4512, 1924), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((31424, 23042), result)
+
+    def test_play_sample_data(self):
+        wins = play(read_input(test_data_input_file))
+        self.assertEqual([2, 0, 1], [board for board, _, _ in wins])
+        self.assertEqual((24, 4512), wins[0][1:])
+        self.assertEqual((13, 1924), wins[-1][1:])
+
+    def test_play_matches_marking_every_board(self):
+        rng = random.Random(4)
+        called = list(range(60)) * 2
+        rng.shuffle(called)
+        boards = []
+        for _ in range(50):
+            numbers = rng.sample(range(60), 12)
+            boards.append([numbers[r * 4:(r + 1) * 4] for r in range(3)])
+
+        data = [','.join(map(str, called))]
+        for board in boards:
+            data.append('')
+            data.extend(' '.join(map(str, line)) for line in board)
+
+        self.assertEqual(self.__play_by_marking(called, boards), play(data))
+        self.assertEqual(play(data), play_numpy(data))
+
+    def test_part1_numpy(self):
+        self.assertEqual(4512, part1_numpy(read_input(test_data_input_file)))
+        self.assertEqual(31424, part1_numpy(read_input(input_file)))
+
+    def test_part2_numpy(self):
+        self.assertEqual(1924, part2_numpy(read_input(test_data_input_file)))
+        self.assertEqual(23042, part2_numpy(read_input(input_file)))
+
+    def test_solve_numpy(self):
+        self.assertEqual((31424, 23042), solve_numpy(read_input(input_file)))
+        self.assertEqual(play(read_input(input_file)), play_numpy(read_input(input_file)))
+
+    def test_play_numpy_boards_that_never_win(self):
+        data = ['1,2,3', '', '1 2', '4 5', '', '3 9', '1 7', '', '2 8', '7 9']
+        self.assertEqual([(0, 2, 18), (1, 3, 48)], play_numpy(data))
+        self.assertEqual(play(data), play_numpy(data))
+        self.assertEqual((18, 48), (part1_numpy(data), part2_numpy(data)))
+        self.assertEqual((18, 48), solve_numpy(data))
+        self.assertEqual((-1, -1), solve_numpy(['5', '', '1 2', '3 4']))
+        self.assertEqual(-1, part2_numpy(['5', '', '1 2', '3 4']))
+
+    def test_numpy_boards_winning_on_the_same_turn(self):
+        data = ['1,2,3', '', '1 2', '7 8', '', '9 1', '8 2', '', '1 9', '2 8']
+        self.assertEqual(play(data), play_numpy(data))
+        self.assertEqual(play(data)[0][2], part1_numpy(data))
+        self.assertEqual(play(data)[-1][2], part2_numpy(data))
+
+    @staticmethod
+    def __play_by_marking(called, boards):
+        marked = [set() for _ in boards]
+        wins = []
+        for number in called:
+            for b, board in enumerate(boards):
+                if b in (w[0] for w in wins):
+                    continue
+                marked[b].add(number)
+                rows = [all(n in marked[b] for n in line) for line in board]
+                cols = [all(line[c] in marked[b] for line in board) for c in range(len(board[0]))]
+                if any(rows) or any(cols):
+                    unmarked = sum(n for line in board for n in line if n not in marked[b])
+                    wins.append((b, number, unmarked * number))
+        return wins
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from shared.file_reader import read_input
+from shared.parse_cache import CACHE_DIR_ENV
+from aoc_2021.day05_hydrothermal_venture import part1, part2, solve, input_file, sample_input_file, \
+    part1_numpy, part2_numpy, solve_numpy, part1_sweep, part2_sweep, solve_sweep
+
+
+class TestDay05(unittest.TestCase):
+    def test_part1_sample_data(self):
+        result = part1(read_input(sample_input_file))
+        self.assertEqual(5, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(5698, result)
+
+    def test_part2_sample_data(self):
+        result = part2(read_input(sample_input_file))
+        self.assertEqual(12, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(15463, result)
+
+    def test_part2_cached_parse(self):
+        data = read_input(input_file)
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch.dict(os.environ, {CACHE_DIR_ENV: cache_dir}):
+            self.assertEqual(15463, part2(data))
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+            self.assertEqual(15463, part2(data))
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(sample_input_file))
+        self.assertEqual((5, 12), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((5698, 15463), result)
+
+    def test_part1_numpy(self):
+        self.assertEqual(5, part1_numpy(read_input(sample_input_file)))
+        self.assertEqual(5698, part1_numpy(read_input(input_file)))
+
+    def test_part2_numpy(self):
+        self.assertEqual(12, part2_numpy(read_input(sample_input_file)))
+        self.assertEqual(15463, part2_numpy(read_input(input_file)))
+
+    def test_solve_numpy(self):
+        self.assertEqual((5698, 15463), solve_numpy(read_input(input_file)))
+        self.assertEqual((0, 0), solve_numpy([]))
+
+    def test_solve_matches_plotting_points(self):
+        rng = random.Random(5)
+        data = []
+        for _ in range(200):
+            # kept away from the edges, so no line goes negative
+            x1, y1 = rng.randrange(8, 30), rng.randrange(8, 30)
+            dx, dy = rng.choice([(1, 0), (0, 1), (-1, 0), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+            length = rng.randrange(8)
+            data.append(f'{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}')
+
+        expected = (self.__count_by_points(data, False), self.__count_by_points(data, True))
+        self.assertEqual(expected, solve(data))
+        self.assertEqual(expected, solve_numpy(data))
+        self.assertEqual(expected, (part1_numpy(data), part2_numpy(data)))
+        self.assertEqual(expected, solve_sweep(data))
+        self.assertEqual(expected, (part1_sweep(data), part2_sweep(data)))
+
+    def test_part1_sweep(self):
+        self.assertEqual(5, part1_sweep(read_input(sample_input_file)))
+        self.assertEqual(5698, part1_sweep(read_input(input_file)))
+
+    def test_part2_sweep(self):
+        self.assertEqual(12, part2_sweep(read_input(sample_input_file)))
+        self.assertEqual(15463, part2_sweep(read_input(input_file)))
+
+    def test_solve_sweep(self):
+        self.assertEqual((5698, 15463), solve_sweep(read_input(input_file)))
+
+    def test_solve_sweep_large_coordinates(self):
+        lines = ((0, 0, 10, 10), (0, 10, 10, 0), (5, 0, 5, 10), (0, 5, 10, 5), (3, 5, 7, 5), (0, 1, 9, 10))
+        expected = solve([f'{x1},{y1} -> {x2},{y2}' for x1, y1, x2, y2 in lines])
+
+        offset = 10 ** 12
+        data = [f'{x1 + offset},{y1 + offset} -> {x2 + offset},{y2 + offset}' for x1, y1, x2, y2 in lines]
+        self.assertEqual(expected, solve_sweep(data))
+
+    @staticmethod
+    def __count_by_points(data, diagonals):
+        seen = {}
+        for line in data:
+            (x1, y1), (x2, y2) = (map(int, end.split(',')) for end in line.split(' -> '))
+            if not diagonals and x1 != x2 and y1 != y2:
+                continue
+            length = max(abs(x2 - x1), abs(y2 - y1))
+            for i in range(length + 1):
+                point = (x1 + (x2 > x1) * i - (x2 < x1) * i, y1 + (y2 > y1) * i - (y2 < y1) * i)
+                seen[point] = seen.get(point, 0) + 1
+        return sum(1 for count in seen.values() if count >= 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
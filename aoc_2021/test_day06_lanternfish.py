@@ -0,0 +1,111 @@
+import unittest
+from shared.file_reader import read_input
+from shared.int_parser import parse_ints
+from aoc_2021.day06_lanternfish import part1, part2, solve, population, populations, input_file, SpawnManager, \
+    solve_numpy, populations_numpy
+
+
+class TestDay06(unittest.TestCase):
+    sample_test_data = '3, 4, 3, 1, 2'
+
+    def test_part1_sample_data(self):
+        result = part1(self.sample_test_data)
+        self.assertEqual(5934, result)
+
+    def test_part1(self):
+        result = part1(read_input(input_file))
+        self.assertEqual(360268, result)
+
+    def test_part2_sample_data(self):
+        result = part2(self.sample_test_data)
+        self.assertEqual(26984457539, result)
+
+    def test_part2(self):
+        result = part2(read_input(input_file))
+        self.assertEqual(1632146183902, result)
+
+    def test_part2_parsed_ints(self):
+        result = part2(parse_ints(read_input(input_file)))
+        self.assertEqual(1632146183902, result)
+
+    def test_solve_sample_data(self):
+        result = solve(self.sample_test_data)
+        self.assertEqual((5934, 26984457539), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((360268, 1632146183902), result)
+
+    def test_population_matches_day_by_day(self):
+        timers = parse_ints(self.sample_test_data)
+        state = [timers.count(t) for t in range(9)]
+        for day in range(300):
+            self.assertEqual(sum(state), population(timers, day))
+            breeding = state.pop(0)
+            state[6] += breeding
+            state.append(breeding)
+
+    def test_populations(self):
+        timers = parse_ints(self.sample_test_data)
+        self.assertEqual([26984457539, 26, 5934, 5], populations(timers, (256, 18, 80, 0)))
+
+    def test_population_modulus(self):
+        timers = parse_ints(self.sample_test_data)
+        modulus = 10 ** 9 + 7
+        self.assertEqual(26984457539 % modulus, population(timers, 256, modulus))
+        self.assertEqual(population(timers, 5000) % modulus, population(timers, 5000, modulus))
+        self.assertLess(population(timers, 10 ** 12, modulus), modulus)
+
+    def test_spawn_manager(self):
+        timers = parse_ints(self.sample_test_data)
+        spawner = SpawnManager(timers)
+        self.assertEqual(5, len(spawner))
+        for day in range(1, 400):
+            spawner.update()
+            self.assertEqual(population(timers, day), spawner.total())
+            if day == 256:
+                self.assertEqual(26984457539, len(spawner))
+
+    def test_spawn_manager_string_timers(self):
+        spawner = SpawnManager('3,4,3,1,2'.split(','))
+        for _ in range(18):
+            spawner.update()
+        self.assertEqual(26, len(spawner))
+
+    def test_spawn_manager_timer_out_of_range(self):
+        with self.assertRaises(ValueError):
+            SpawnManager([3, 9])
+        with self.assertRaises(ValueError):
+            SpawnManager([-1])
+
+    def test_solve_numpy(self):
+        self.assertEqual((5934, 26984457539), solve_numpy(self.sample_test_data))
+        self.assertEqual((360268, 1632146183902), solve_numpy(read_input(input_file)))
+
+    def test_populations_numpy(self):
+        schools = [parse_ints(self.sample_test_data), [0], [], [8, 8, 1]]
+        horizons = [256, 0, 18, 80]
+        expected = [populations(timers, horizons) for timers in schools]
+        self.assertEqual(expected, populations_numpy(schools, horizons).T.tolist())
+
+    def test_populations_numpy_lifecycle(self):
+        schools = [[3, 1], [0, 4, 4], [2]]
+        resets = [6, 2, 4]
+        newborns = [8, 3, 9]
+        result = populations_numpy(schools, [0, 10, 30], reset=resets, newborn=newborns, dtype=object)
+
+        for i, timers in enumerate(schools):
+            fish = list(timers)
+            for day in range(31):
+                if day in (0, 10, 30):
+                    self.assertEqual(len(fish), result[[0, 10, 30].index(day), i])
+                new = [newborns[i]] * fish.count(0)
+                fish = [resets[i] if t == 0 else t - 1 for t in fish] + new
+
+    def test_population_negative_days(self):
+        with self.assertRaises(ValueError):
+            population([3], -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import random
+import unittest
+from shared.file_reader import read_input
+from shared.int_parser import parse_ints
+from aoc_2021.day07_the_treachery_of_whales import part1, part2, solve, input_file, FuelCosts, \
+    part1_numpy, part2_numpy, solve_numpy, cost_curve_numpy, best_target_convex_numpy, linear_cost, triangular_cost
+
+
+class TestDay07(unittest.TestCase):
+    sample_test_data = '16, 1, 2, 0, 4, 2, 7, 1, 2, 14'
+
+    def test_part1_sample_data(self):
+        result = part1(self.sample_test_data)
+        self.assertEqual(37, result)
+
+    def test_part1(self):
+        result = part1(read_input(input_file))
+        self.assertEqual(340987, result)
+
+    def test_part2_sample_data(self):
+        result = part2(self.sample_test_data)
+        self.assertEqual(168, result)
+
+    def test_part2(self):
+        result = part2(read_input(input_file))
+        self.assertEqual(96987874, result)
+
+    def test_part1_parsed_ints(self):
+        result = part1(parse_ints(read_input(input_file)))
+        self.assertEqual(340987, result)
+
+    def test_solve_sample_data(self):
+        result = solve(self.sample_test_data)
+        self.assertEqual((37, 168), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((340987, 96987874), result)
+
+    def test_fuel_costs_match_brute_force(self):
+        rng = random.Random(7)
+        for size in (1, 2, 3, 10, 50):
+            positions = [rng.randrange(-20, 40) for _ in range(size)]
+            costs = FuelCosts(positions)
+
+            targets = range(-25, 45)
+            linear = [sum(abs(t - p) for p in positions) for t in targets]
+            triangular = [sum(abs(t - p) * (abs(t - p) + 1) // 2 for p in positions) for t in targets]
+
+            self.assertEqual(linear, [costs.linear(t) for t in targets])
+            self.assertEqual(triangular, [costs.triangular(t) for t in targets])
+            self.assertEqual(min(linear), costs.best_linear()[1])
+            self.assertEqual(min(triangular), costs.best_triangular()[1])
+
+    def test_fuel_costs_large_positions(self):
+        costs = FuelCosts([0, 10 ** 9, 10 ** 9, 3])
+        self.assertEqual((3, 2 * (10 ** 9 - 3) + 3), costs.best_linear())
+        self.assertEqual(costs.triangular(costs.best_triangular()[0]), costs.best_triangular()[1])
+
+    def test_part1_numpy(self):
+        self.assertEqual(37, part1_numpy(self.sample_test_data))
+        self.assertEqual(340987, part1_numpy(read_input(input_file)))
+
+    def test_part2_numpy(self):
+        self.assertEqual(168, part2_numpy(self.sample_test_data))
+        self.assertEqual(96987874, part2_numpy(read_input(input_file)))
+
+    def test_solve_numpy(self):
+        self.assertEqual((340987, 96987874), solve_numpy(read_input(input_file)))
+
+    def test_cost_curve_numpy(self):
+        positions = list(parse_ints(self.sample_test_data))
+        costs = FuelCosts(positions)
+
+        target, cost, curve = cost_curve_numpy(positions, triangular_cost)
+        self.assertEqual((5, 168), (target, cost))
+        self.assertEqual([costs.triangular(t) for t in range(0, 17)], curve.tolist())
+
+        target, cost, curve = cost_curve_numpy(positions, linear_cost)
+        self.assertEqual((2, 37), (target, cost))
+        self.assertEqual([costs.linear(t) for t in range(0, 17)], curve.tolist())
+
+    def test_cost_curve_numpy_weights_and_other_kernels(self):
+        rng = random.Random(24)
+        positions = [rng.randrange(5, 60) for _ in range(40)]
+        weights = [rng.randrange(1, 5) for _ in positions]
+
+        def capped(d):
+            return d - (d - 10) * (d > 10)
+
+        def quadratic(d):
+            return d * d
+
+        for kernel in (linear_cost, triangular_cost, quadratic, capped):
+            targets = range(min(positions), max(positions) + 1)
+            expected = [sum(w * int(kernel(abs(t - p))) for p, w in zip(positions, weights)) for t in targets]
+            target, cost, curve = cost_curve_numpy(positions, kernel, weights)
+            self.assertEqual(expected, curve.tolist())
+            self.assertEqual(min(expected), cost)
+            self.assertEqual(expected[target - min(positions)], cost)
+
+            if kernel is not capped:
+                self.assertEqual(min(expected), best_target_convex_numpy(positions, kernel, weights)[1])
+
+    def test_numpy_costs_too_big_for_int64(self):
+        positions = [0, 10 ** 9, 10 ** 9, 3] * 1000
+        expected = FuelCosts(positions).best_triangular()
+        self.assertEqual(expected, best_target_convex_numpy(positions, triangular_cost))
+        self.assertEqual(expected[1], part2_numpy(','.join(map(str, positions))))
+        self.assertEqual(FuelCosts(positions).best_linear()[1], best_target_convex_numpy(positions, linear_cost)[1])
+
+        positions = [0, 2, 2, 40]
+        weights = [10 ** 17 + 1] * 4
+        expected = [sum(w * (t - p) ** 4 for p, w in zip(positions, weights)) for t in range(0, 41)]
+        target, cost, curve = cost_curve_numpy(positions, lambda d: d ** 4, weights)
+        self.assertEqual(expected, curve.tolist())
+        self.assertEqual(min(expected), cost)
+        self.assertEqual(min(expected), best_target_convex_numpy(positions, lambda d: d ** 4, weights)[1])
+
+    def test_cost_curve_numpy_float_kernels(self):
+        import numpy as np
+
+        target, cost, curve = cost_curve_numpy([0, 1, 5], lambda d: 0.5 * d)
+        self.assertEqual((1, 2.5), (target, cost))
+        self.assertEqual([3, 2.5, 3, 3.5, 4, 4.5], curve.tolist())
+
+        positions = [0, 1, 5, 9, 9]
+        weights = [1.5, 2, 0.25, 1, 3]
+        for kernel in (np.sqrt, lambda d: np.power(d, 1.5)):
+            targets = range(0, 10)
+            expected = [sum(w * float(kernel(abs(t - p))) for p, w in zip(positions, weights)) for t in targets]
+
+            target, cost, curve = cost_curve_numpy(positions, kernel, weights)
+            np.testing.assert_allclose(expected, curve)
+            self.assertAlmostEqual(min(expected), cost)
+            self.assertEqual(expected.index(min(expected)), target)
+
+        expected = [sum(float(np.power(abs(t - p), 1.5)) for p in positions) for t in range(0, 10)]
+        target, cost = best_target_convex_numpy(positions, lambda d: np.power(d, 1.5))
+        self.assertAlmostEqual(min(expected), cost)
+        self.assertEqual(expected.index(min(expected)), target)
+
+    def test_best_target_convex_numpy_flat_costs(self):
+        # every target between 0 and 10 costs the same
+        self.assertEqual(10, best_target_convex_numpy([0, 10], linear_cost)[1])
+        self.assertEqual(20, best_target_convex_numpy([0, 0, 10, 10], linear_cost)[1])
+        self.assertEqual(4, best_target_convex_numpy([0, 10], lambda d: (d - 3) * (d > 3))[1])
+
+    def test_fuel_costs_no_crabs(self):
+        with self.assertRaises(ValueError):
+            FuelCosts([])
+
+
+if __name__ == '__main__':
+    unittest.main()
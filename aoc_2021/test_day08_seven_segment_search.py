@@ -0,0 +1,67 @@
+import itertools
+import random
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day08_seven_segment_search import part1, part2, solve, input_file, test_input_file, \
+    part2_numpy, solve_numpy
+
+
+class TestDay08(unittest.TestCase):
+
+    def test_part1_sample_data(self):
+        data = read_input(test_input_file)
+        result = part1(data)
+        self.assertEqual(26, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(543, result)
+
+    def test_part2_sample_data(self):
+        data = read_input(test_input_file)
+        result = part2(data)
+        self.assertEqual(61229, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(994266, result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(test_input_file))
+        self.assertEqual((26, 61229), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((543, 994266), result)
+
+    def test_part2_numpy(self):
+        self.assertEqual(61229, part2_numpy(read_input(test_input_file)))
+        self.assertEqual(part2(read_input(input_file)), part2_numpy(read_input(input_file)))
+
+    def test_solve_numpy(self):
+        self.assertEqual(solve(read_input(input_file)), solve_numpy(read_input(input_file)))
+
+    def test_every_wiring(self):
+        digits = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+        rng = random.Random(8)
+        data = []
+        expected = 0
+        for wiring in itertools.permutations('abcdefg'):
+            wire = dict(zip('abcdefg', wiring))
+            scrambled = [''.join(rng.sample([wire[c] for c in d], len(d))) for d in digits]
+            shown = [rng.randrange(10) for _ in range(4)]
+            data.append(' '.join(rng.sample(scrambled, 10)) + ' | ' + ' '.join(scrambled[d] for d in shown))
+            expected += int(''.join(map(str, shown)))
+
+        self.assertEqual(expected, part2(data))
+        self.assertEqual(expected, part2_numpy(data))
+
+    def test_malformed_entry(self):
+        with self.assertRaises(ValueError):
+            part2(['ab cd | ef'])
+
+
+if __name__ == '__main__':
+    unittest.main()
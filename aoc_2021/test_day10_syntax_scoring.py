@@ -0,0 +1,37 @@
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day10_syntax_scoring import part1, part2, solve, input_file, input_test_file
+
+
+class TestDay10(unittest.TestCase):
+    def test_part1_sample_data(self):
+        data = read_input(input_test_file)
+        result = part1(data)
+        self.assertEqual(26397, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(216297, result)
+
+    def test_part2_sample_data(self):
+        data = read_input(input_test_file)
+        result = part2(data)
+        self.assertEqual(288957, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(2165057169, result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(input_test_file))
+        self.assertEqual((26397, 288957), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((216297, 2165057169), result)
+
+
+if __name__ == '__main__':
+    unittest.main()
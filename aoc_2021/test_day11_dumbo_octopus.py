@@ -0,0 +1,42 @@
+import unittest
+from aoc.generators import generate
+from shared.file_reader import read_input
+from aoc_2021.day11_dumbo_octopus import part1, part2, solve, input_file, test_input_file
+
+
+class TestDay11(unittest.TestCase):
+    def test_part1_sample_data(self):
+        data = read_input(test_input_file)
+        result = part1(data)
+        self.assertEqual(1656, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(1642, result)
+
+    def test_part2_sample_data(self):
+        data = read_input(test_input_file)
+        result = part2(data)
+        self.assertEqual(195, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(320, result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(test_input_file))
+        self.assertEqual((1656, 195), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((1642, 320), result)
+
+    def test_solve_matches_parts_on_generated_grid(self):
+        data = ''.join(generate(2021, 11, 10, seed=0)).splitlines()
+        self.assertEqual((part1(data), part2(data)), solve(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
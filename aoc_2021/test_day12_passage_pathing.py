@@ -0,0 +1,38 @@
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day12_passage_pathing import part1, part2, solve, input_file, test_input_file
+
+
+class TestDay12(unittest.TestCase):
+
+    def test_part1_sample_data(self):
+        data = read_input(test_input_file)
+        result = part1(data)
+        self.assertEqual(10, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(5920, result)
+
+    def test_part2_sample_data(self):
+        data = read_input(test_input_file)
+        result = part2(data)
+        self.assertEqual(36, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        self.assertEqual(155477, result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(test_input_file))
+        self.assertEqual((10, 36), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((5920, 155477), result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from shared.file_reader import read_input
+from aoc_2021.day13_transparent_origami import part1, part2, solve, input_file, test_input_file
+
+
+class TestDay13(unittest.TestCase):
+    def test_part1_sample_data(self):
+        data = read_input(test_input_file)
+        result = part1(data)
+        self.assertEqual(17, result)
+
+    def test_part1(self):
+        data = read_input(input_file)
+        result = part1(data)
+        self.assertEqual(770, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+        result = part2(data)
+        # self.assertEqual('EPUELPBR', result)
+
+    def test_solve_sample_data(self):
+        result = solve(read_input(test_input_file))
+        self.assertEqual((17, None), result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((770, None), result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,54 +5,44 @@ https://adventofcode.com/2022/day/1
 Note: This is a competitive programming exercise.
 Implemented for speed in terms of solving the solution in as short a time as possible.
 """
-import unittest
-from shared.file_reader import read_input
+import heapq
+from shared.profiling import profiled
 
 input_file = r'resources/day01_input.txt'
 
 
+@profiled
 def part1(data):
-    max_cals = -1
-    cals = 0
+    return max(__top_totals(data, 1), default=-1)
 
-    for n in data:
-        if n == '':
-            max_cals = max(max_cals, cals)
-            cals = 0
-        else:
-            cals += int(n)
 
-    return max_cals
+@profiled
+def part2(data):
+    return sum(__top_totals(data, 3))
+
 
+@profiled
+def solve(data):
+    """
+    Both parts in one pass, the largest of the top three totals being part 1's answer
+    """
+    totals = __top_totals(data, 3)
+    return max(totals, default=-1), sum(totals)
 
-def part2(data):
+
+def __top_totals(data, count):
+    # only the top totals are kept (as a min heap), rather than a list of every elf's total
     cals = 0
     totals = []
 
     for n in data:
         if n == '':
-            totals.append(cals)
+            if len(totals) < count:
+                heapq.heappush(totals, cals)
+            else:
+                heapq.heappushpop(totals, cals)
             cals = 0
         else:
             cals += int(n)
 
-    totals.sort(reverse=True)
-    return sum(totals[:3])
-
-
-class TestDay01(unittest.TestCase):
-    def test_part1(self):
-        data = read_input(input_file)
-
-        result = part1(data)
-        self.assertEqual(72602, result)
-
-    def test_part2(self):
-        data = read_input(input_file)
-
-        result = part2(data)
-        self.assertEqual(207410, result)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    return totals
@@ -0,0 +1,33 @@
+import unittest
+from shared.file_reader import read_input, stream_input
+from aoc_2022.day01 import part1, part2, solve, input_file
+
+
+class TestDay01(unittest.TestCase):
+    def test_part1(self):
+        data = read_input(input_file)
+
+        result = part1(data)
+        self.assertEqual(72602, result)
+
+    def test_part2(self):
+        data = read_input(input_file)
+
+        result = part2(data)
+        self.assertEqual(207410, result)
+
+    def test_part1_streamed(self):
+        result = part1(stream_input(input_file))
+        self.assertEqual(72602, result)
+
+    def test_part2_streamed(self):
+        result = part2(stream_input(input_file))
+        self.assertEqual(207410, result)
+
+    def test_solve(self):
+        result = solve(read_input(input_file))
+        self.assertEqual((72602, 207410), result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,37 @@
+import mmap
+import os
+
+
 def read_input(filename):
     data = []
     with open(filename) as file:
         for line in file:
             data.append(line.strip('\n'))
-    return data
\ No newline at end of file
+    return data
+
+
+def stream_input(filename):
+    """
+    Lazily yield the lines of a file, without building a list of the whole file.
+    The file is memory mapped, so only the line currently being processed is held as a Python object,
+    meaning a solver that iterates over its data runs in constant memory, whatever the size of the input.
+    :param filename: input file
+    :return: generator of lines, with the line endings removed (same lines as read_input)
+    """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            end = len(mm)
+            while start < end:
+                stop = mm.find(b'\n', start)
+                if stop == -1:
+                    stop = end
+
+                line = mm[start:stop]
+                if line.endswith(b'\r'):
+                    line = line[:-1]
+                yield line.decode()
+                start = stop + 1
@@ -0,0 +1,68 @@
+from array import array
+
+
+def parse_ints(data, sep=','):
+    """
+    Parse separated integers into a compact array of 64 bit ints, in one bulk pass.
+    :param data: a separated string e.g. '3,4,3,1,2', a list of lines of separated integers, or already parsed ints
+    :param sep: separator, None splits on any whitespace (including newlines)
+    :return: array('q') of the integers
+    """
+    if isinstance(data, array):
+        return data
+
+    if isinstance(data, str):
+        return array('q', map(int, data.split(sep)))
+
+    data = list(data)
+    if data and isinstance(data[0], str):
+        joiner = ' ' if sep is None else sep
+        return array('q', map(int, joiner.join(line for line in data if line.strip()).split(sep)))
+
+    return array('q', data)
+
+
+def read_ints(filename, sep=None):
+    """
+    Read a file of integers (one per line by default) into a compact array of 64 bit ints, in one bulk pass.
+    :param filename: input file
+    :param sep: separator, None splits on any whitespace (including newlines)
+    :return: array('q') of the integers
+    """
+    with open(filename) as file:
+        return array('q', map(int, file.read().split(sep)))
+
+
+def read_int_ndarray(filename, sep=' '):
+    """
+    Read a file of integers straight into a NumPy int64 array, parsed in C with no Python level loop.
+    NumPy is only imported when this is called.
+    :param filename: input file
+    :param sep: separator, ' ' matches any whitespace (including newlines)
+    :return: numpy.ndarray of int64
+    """
+    import numpy as np
+
+    return np.fromfile(filename, dtype=np.int64, sep=sep)
+
+
+def to_int_ndarray(data, sep=','):
+    """
+    Convert input data to a NumPy int64 array, in bulk.
+    :param data: a NumPy array, a separated string, a list of lines, or a sequence of ints
+    :param sep: separator for strings, None splits on any whitespace
+    :return: numpy.ndarray of int64
+    """
+    import numpy as np
+
+    if isinstance(data, np.ndarray):
+        return data.astype(np.int64, copy=False)
+
+    if isinstance(data, str):
+        return np.array(data.split(sep)).astype(np.int64)
+
+    data = list(data)
+    if data and isinstance(data[0], str):
+        joiner = ' ' if sep is None else sep
+        return np.array(joiner.join(line for line in data if line.strip()).split(sep)).astype(np.int64)
+    return np.array(data, dtype=np.int64)
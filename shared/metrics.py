@@ -0,0 +1,87 @@
+import os
+
+# Set to any non-empty value (other than '0') to count the hot operations in the solutions.
+# Read when the counters are created (i.e. on import of a solution), when unset every counter is a shared no-op.
+METRICS_ENV = 'AOC_METRICS'
+
+registry = {}
+
+
+class Counter:
+    __slots__ = ('name', 'help', 'value')
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+
+class NullCounter:
+    __slots__ = ()
+
+    def inc(self, n=1):
+        pass
+
+
+null_counter = NullCounter()
+
+
+def is_enabled():
+    return os.environ.get(METRICS_ENV, '0') not in ('', '0')
+
+
+def enable():
+    """
+    Switch metrics on for solution modules imported from now on. Sets AOC_METRICS, so worker processes inherit it.
+    """
+    os.environ[METRICS_ENV] = '1'
+
+
+def counter(name, help_text=''):
+    """
+    Get (or create) a counter in the registry, e.g. counter('aoc_2021_day12_stack_pushes_total', 'Paths pushed')
+    :return: the counter, or a no-op counter if metrics are disabled
+    """
+    if not is_enabled():
+        return null_counter
+
+    if name not in registry:
+        registry[name] = Counter(name, help_text)
+    return registry[name]
+
+
+def reset():
+    for c in registry.values():
+        c.value = 0
+
+
+def snapshot(prefix=''):
+    """
+    :param prefix: only include the counters with names starting with this prefix e.g. 'aoc_2021_day09_'
+    :return: dict of counter name -> {'help': ..., 'value': ...}
+    """
+    return {name: {'help': c.help, 'value': c.value} for name, c in sorted(registry.items()) if name.startswith(prefix)}
+
+
+def to_json(counters=None):
+    import json
+
+    counters = snapshot() if counters is None else counters
+    return json.dumps({name: c['value'] for name, c in counters.items()}, indent=2)
+
+
+def to_prometheus(counters=None):
+    """
+    Format counters in the Prometheus text exposition format
+    """
+    counters = snapshot() if counters is None else counters
+    lines = []
+    for name, c in counters.items():
+        if c['help']:
+            lines.append(f"# HELP {name} {c['help']}")
+        lines.append(f'# TYPE {name} counter')
+        lines.append(f"{name} {c['value']}")
+    return '\n'.join(lines) + '\n'
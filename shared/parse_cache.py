@@ -0,0 +1,66 @@
+import functools
+import os
+
+# Caching is switched on by pointing this environment variable at a directory to hold the cached results
+CACHE_DIR_ENV = 'AOC_CACHE_DIR'
+
+
+def cached_parser(version=1):
+    """
+    Decorator for a parser taking the list of input lines. The parsed result is pickled to disk, keyed by a hash of
+    the input, the parser name and its version, so repeated runs on the same input skip parsing entirely.
+    Changing the input gives a new key, so stale entries are never read. Bump the version when the parser changes.
+    Does nothing unless the AOC_CACHE_DIR environment variable is set.
+    :param version: parser version, part of the cache key
+    """
+    def decorator(parser):
+        @functools.wraps(parser)
+        def wrapper(data):
+            cache_dir = os.environ.get(CACHE_DIR_ENV)
+            if not cache_dir or not isinstance(data, list):
+                return parser(data)
+
+            # only imported once caching is used, as they are slow to import compared to the solutions
+            import pickle
+
+            path = os.path.join(cache_dir, __cache_key(parser, version, data) + '.pickle')
+            try:
+                with open(path, 'rb') as file:
+                    return pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, ValueError):
+                # missing or corrupt entry, parsed again and rewritten below
+                pass
+
+            result = parser(data)
+            __store(path, result)
+            return result
+
+        return wrapper
+    return decorator
+
+
+def __cache_key(parser, version, data):
+    import hashlib
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{parser.__module__}.{parser.__qualname__}:{version}\n'.encode())
+    h.update('\n'.join(data).encode())
+    return h.hexdigest()
+
+
+def __store(path, result):
+    import pickle
+
+    # write to a temporary file first, so a concurrent reader never sees a partly written cache entry
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError:
+        # the cache is only an optimisation, an unwritable cache directory just means parsing every time
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
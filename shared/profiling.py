@@ -0,0 +1,144 @@
+import functools
+import os
+import sys
+import time
+
+# Comma separated list of what to profile: 'cprofile', 'memory' and/or 'phases', or 'all'.
+# Read once at import, when unset the decorators below return the function unchanged, so there is no overhead.
+PROFILE_ENV = 'AOC_PROFILE'
+# Optional directory to write the raw cProfile stats to, for loading into pstats or a viewer
+PROFILE_DIR_ENV = 'AOC_PROFILE_DIR'
+
+all_modes = {'cprofile', 'memory', 'phases'}
+
+
+def __read_modes():
+    value = os.environ.get(PROFILE_ENV, '').strip().lower()
+    if not value or value == '0':
+        return set()
+    if value in ('1', 'all'):
+        return set(all_modes)
+    return {mode.strip() for mode in value.split(',')} & all_modes
+
+
+modes = __read_modes()
+phase_times = {}
+# number of profiled calls in progress, a profiled call inside another is just part of the outer one's report
+active = 0
+
+
+def enable(value):
+    """
+    Switch profiling on for solution modules imported from now on, e.g. enable('phases,memory').
+    Sets AOC_PROFILE too, so worker processes inherit the setting.
+    """
+    os.environ[PROFILE_ENV] = value
+    modes.clear()
+    modes.update(__read_modes())
+
+
+def phase(name):
+    """
+    Decorator to time a function as part of a named phase, e.g. 'parse', 'solve' or 'render'.
+    The times are reported by the enclosing profiled part. Don't use on recursive functions, as time is inclusive
+    """
+    def decorator(func):
+        if 'phases' not in modes:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                phase_times[name] = phase_times.get(name, 0.0) + time.perf_counter() - start
+
+        return wrapper
+    return decorator
+
+
+def profiled(func):
+    """
+    Decorator for part1 / part2. Depending on AOC_PROFILE, reports the time spent in each phase,
+    the cProfile stats and the tracemalloc peak and top allocations to stderr.
+    Calls made while a profiled function is already running pass straight through
+    """
+    if not modes:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global active
+        if active:
+            return func(*args, **kwargs)
+
+        active += 1
+        try:
+            return __profile(func, *args, **kwargs)
+        finally:
+            active -= 1
+
+    return wrapper
+
+
+def __profile(func, *args, **kwargs):
+    import cProfile
+    import tracemalloc
+
+    name = f'{func.__module__}.{func.__qualname__}'
+    phase_times.clear()
+
+    profiler = cProfile.Profile() if 'cprofile' in modes else None
+    if 'memory' in modes:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+
+        print(f'== {name}: {elapsed * 1000:.3f} ms', file=sys.stderr)
+        if 'phases' in modes:
+            __report_phases(elapsed)
+        if profiler:
+            __report_profile(profiler, name)
+        if 'memory' in modes:
+            __report_memory()
+            tracemalloc.stop()
+
+
+def __report_phases(elapsed):
+    other = elapsed
+    for name, seconds in phase_times.items():
+        print(f'   phase {name:<10} {seconds * 1000:>10.3f} ms', file=sys.stderr)
+        other -= seconds
+    print(f"   phase {'other':<10} {max(other, 0.0) * 1000:>10.3f} ms", file=sys.stderr)
+
+
+def __report_profile(profiler, name):
+    import pstats
+
+    profile_dir = os.environ.get(PROFILE_DIR_ENV)
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(profile_dir, f'{name}.prof'))
+
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.sort_stats('cumulative').print_stats(15)
+
+
+def __report_memory():
+    import tracemalloc
+
+    peak = tracemalloc.get_traced_memory()[1]
+    print(f'   memory peak {peak / 1024:.1f} KiB, top allocations:', file=sys.stderr)
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__),
+                                                         tracemalloc.Filter(False, tracemalloc.__file__)])
+    for stat in snapshot.statistics('lineno')[:10]:
+        print(f'   {stat}', file=sys.stderr)
@@ -0,0 +1,68 @@
+import json
+import os
+import unittest
+from unittest import mock
+from shared import metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict(metrics.registry, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env_patcher = mock.patch.dict(os.environ, {metrics.METRICS_ENV: '1'})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def test_counter(self):
+        c = metrics.counter('test_lookups_total', 'Lookups')
+        c.inc()
+        c.inc(4)
+        self.assertIs(c, metrics.counter('test_lookups_total'))
+        self.assertEqual(5, metrics.registry['test_lookups_total'].value)
+
+    def test_disabled_returns_null_counter(self):
+        for value in ('', '0'):
+            with self.subTest(value=value), mock.patch.dict(os.environ, {metrics.METRICS_ENV: value}):
+                self.assertFalse(metrics.is_enabled())
+                c = metrics.counter('test_disabled_total')
+                self.assertIs(metrics.null_counter, c)
+                c.inc(3)
+                self.assertEqual({}, metrics.snapshot())
+
+    def test_enable(self):
+        with mock.patch.dict(os.environ):
+            del os.environ[metrics.METRICS_ENV]
+            self.assertFalse(metrics.is_enabled())
+            metrics.enable()
+            self.assertTrue(metrics.is_enabled())
+
+    def test_snapshot_prefix_and_reset(self):
+        metrics.counter('aoc_2021_day09_a_total', 'A').inc(2)
+        metrics.counter('aoc_2021_day10_b_total', 'B').inc(3)
+
+        self.assertEqual({'aoc_2021_day09_a_total': {'help': 'A', 'value': 2}}, metrics.snapshot('aoc_2021_day09_'))
+        self.assertEqual(['aoc_2021_day09_a_total', 'aoc_2021_day10_b_total'], list(metrics.snapshot()))
+
+        metrics.reset()
+        self.assertEqual(0, metrics.snapshot()['aoc_2021_day10_b_total']['value'])
+
+    def test_to_json(self):
+        metrics.counter('b_total').inc(2)
+        metrics.counter('a_total').inc()
+        self.assertEqual({'a_total': 1, 'b_total': 2}, json.loads(metrics.to_json()))
+        self.assertEqual({'a_total': 1}, json.loads(metrics.to_json(metrics.snapshot('a_'))))
+
+    def test_to_prometheus(self):
+        metrics.counter('a_total', 'Things counted').inc(7)
+        metrics.counter('b_total').inc()
+        self.assertEqual('# HELP a_total Things counted\n'
+                         '# TYPE a_total counter\n'
+                         'a_total 7\n'
+                         '# TYPE b_total counter\n'
+                         'b_total 1\n', metrics.to_prometheus())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from shared.parse_cache import CACHE_DIR_ENV, cached_parser
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV: self.cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.calls = 0
+
+    def parser(self, version=1):
+        @cached_parser(version=version)
+        def parse(data):
+            self.calls += 1
+            return [int(line) for line in data]
+        return parse
+
+    def entries(self):
+        return os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+
+    def test_hit(self):
+        parse = self.parser()
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual(1, self.calls)
+        self.assertEqual(1, len(self.entries()))
+
+    def test_changed_input_misses(self):
+        parse = self.parser()
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual([1, 3], parse(['1', '3']))
+        self.assertEqual(2, self.calls)
+        self.assertEqual(2, len(self.entries()))
+
+    def test_version_bump_misses(self):
+        self.assertEqual([1, 2], self.parser(version=1)(['1', '2']))
+        self.assertEqual([1, 2], self.parser(version=2)(['1', '2']))
+        self.assertEqual(2, self.calls)
+
+    def test_corrupt_entry_parses_again(self):
+        parse = self.parser()
+        parse(['1', '2'])
+        for name in self.entries():
+            with open(os.path.join(self.cache_dir, name), 'wb') as file:
+                file.write(b'not a pickle')
+
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual(2, self.calls)
+        # and the entry is rewritten
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual(2, self.calls)
+
+    def test_truncated_entry_parses_again(self):
+        parse = self.parser()
+        parse(['1', '2'])
+        for name in self.entries():
+            open(os.path.join(self.cache_dir, name), 'wb').close()
+
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual(2, self.calls)
+
+    def test_unwritable_directory(self):
+        # a file where the cache directory should be, so the directory can never be created (even as root)
+        open(self.cache_dir, 'w').close()
+        parse = self.parser()
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual([1, 2], parse(['1', '2']))
+        self.assertEqual(2, self.calls)
+
+    def test_disabled(self):
+        with mock.patch.dict(os.environ):
+            del os.environ[CACHE_DIR_ENV]
+            parse = self.parser()
+            parse(['1', '2'])
+            parse(['1', '2'])
+        self.assertEqual(2, self.calls)
+        self.assertEqual([], self.entries())
+
+
+if __name__ == '__main__':
+    unittest.main()